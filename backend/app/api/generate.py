@@ -103,8 +103,7 @@ async def generate_code(
 
         # Create ZIP file in user-scoped directory
         user_utils = _user_file_utils(current_user.id)
-        zip_bytes, zip_filename = user_utils.create_zip_from_files(generated_files)
-        user_utils.save_zip_to_disk(zip_bytes, zip_filename)
+        _, zip_filename = user_utils.write_zip_to_disk(generated_files)
 
         # Clean up old files occasionally
         try:
@@ -56,6 +56,11 @@ class Settings(BaseSettings):
     MAX_UPLOAD_SIZE_MB: int = 10
     UPLOAD_DIR: str = "./uploads"
 
+    # Terraform
+    # Concurrent resource operations per plan/apply/destroy; lower it for
+    # accounts that hit provider API rate limits
+    TERRAFORM_PARALLELISM: int = 20
+
     @model_validator(mode="after")
     def validate_secret_key(self) -> "Settings":
         """Warn or fail if SECRET_KEY is the insecure default."""
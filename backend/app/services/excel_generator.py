@@ -1,13 +1,43 @@
 """Excel template generator service."""
 
 import io
+from functools import lru_cache
+
 import xlsxwriter
+from xlsxwriter.utility import xl_range
 from app.schemas import TemplateType
 
+# Last zero-based row index Excel supports; validations run to the end of the column
+EXCEL_MAX_ROW = 1048575
+
+# Excel caps an inline list formula ("a,b,c") at 255 characters
+INLINE_LIST_MAX_LENGTH = 255
+
+
+@lru_cache(maxsize=None)
+def _list_source(options):
+    """Return the data validation source for an option tuple.
+
+    Short option sets are embedded directly as an inline list formula;
+    anything that cannot be inlined falls back to xlsxwriter's list form.
+    """
+    if all("," not in opt and '"' not in opt for opt in options):
+        source = '"' + ",".join(options) + '"'
+        if len(source) - 2 <= INLINE_LIST_MAX_LENGTH:
+            return source
+    return list(options)
+
 
 class ExcelGeneratorService:
     """Service for generating Excel templates."""
 
+    # xlsxwriter options: stream rows to disk and keep sample values as plain text
+    WORKBOOK_OPTIONS = {
+        "constant_memory": True,
+        "strings_to_formulas": False,
+        "strings_to_urls": False,
+    }
+
     # Column definitions based on specification
     COMMON_COLUMNS = [
         "ResourceName",
@@ -18,9 +48,9 @@ class ExcelGeneratorService:
         "Tags",
     ]
 
-    # Dropdown options
-    ENVIRONMENTS = ["Development", "Testing", "Staging", "Production", "DR"]
-    AWS_REGIONS = [
+    # Dropdown options (tuples so every sheet shares the same objects)
+    ENVIRONMENTS = ("Development", "Testing", "Staging", "Production", "DR")
+    AWS_REGIONS = (
         "us-east-1",
         "us-east-2",
         "us-west-1",
@@ -29,8 +59,8 @@ class ExcelGeneratorService:
         "eu-central-1",
         "ap-southeast-1",
         "ap-northeast-1",
-    ]
-    AZURE_REGIONS = [
+    )
+    AZURE_REGIONS = (
         "eastus",
         "eastus2",
         "westus",
@@ -41,8 +71,83 @@ class ExcelGeneratorService:
         "uksouth",
         "southeastasia",
         "eastasia",
-    ]
-    BOOLEAN_OPTIONS = ["true", "false"]
+    )
+    BOOLEAN_OPTIONS = ("true", "false")
+    YN_OPTIONS = ("y", "n")
+    ENABLED_DISABLED_OPTIONS = ("Enabled", "Disabled")
+
+    # Dropdown definitions per cloud: (column name, allowed values)
+    AWS_DROPDOWNS = (
+        ("Region", AWS_REGIONS),
+        ("AssociatePublicIP", BOOLEAN_OPTIONS),
+        ("EnableDNSHostnames", BOOLEAN_OPTIONS),
+        ("EnableDNSSupport", BOOLEAN_OPTIONS),
+        ("MapPublicIP", BOOLEAN_OPTIONS),
+        ("Versioning", ("Enabled", "Suspended")),
+        ("BlockPublicAccess", BOOLEAN_OPTIONS),
+        ("MultiAZ", BOOLEAN_OPTIONS),
+        ("PubliclyAccessible", BOOLEAN_OPTIONS),
+        ("StorageEncrypted", BOOLEAN_OPTIONS),
+        ("DeletionProtection", BOOLEAN_OPTIONS),
+        ("SubnetType", ("Public", "Private")),
+        # Exists fields
+        ("VPCExists", YN_OPTIONS),
+        ("SubnetExists", YN_OPTIONS),
+        ("SecurityGroupsExist", YN_OPTIONS),
+        # Internet Gateway and NAT Gateway
+        ("InternetGatewayExists", YN_OPTIONS),
+        ("ConnectivityType", ("public", "private")),
+        # Elastic IP
+        ("Domain", ("vpc", "standard")),
+        ("InstanceExists", YN_OPTIONS),
+        ("NetworkInterfaceExists", YN_OPTIONS),
+        # Load Balancer
+        ("Type", ("application", "network")),
+        ("Scheme", ("internet-facing", "internal")),
+        ("IPAddressType", ("ipv4", "dualstack")),
+        ("CrossZoneEnabled", BOOLEAN_OPTIONS),
+        ("ListenerProtocol", ("HTTP", "HTTPS", "TCP", "UDP", "TLS")),
+        ("ListenerTargetGroupExists", YN_OPTIONS),
+        # Target Group
+        ("Protocol", ("HTTP", "HTTPS", "TCP", "UDP", "TLS", "GENEVE")),
+        ("TargetType", ("instance", "ip", "lambda", "alb")),
+        ("HealthCheckProtocol", ("HTTP", "HTTPS", "TCP")),
+        ("StickinessEnabled", BOOLEAN_OPTIONS),
+        ("StickinessType", ("lb_cookie", "app_cookie")),
+    )
+    AZURE_DROPDOWNS = (
+        ("Location", AZURE_REGIONS),
+        ("OSType", ("Linux", "Windows")),
+        ("AuthenticationType", ("Password", "SSH")),
+        ("OSDiskType", ("StandardSSD_LRS", "Premium_LRS", "Standard_LRS")),
+        ("AssignPublicIP", BOOLEAN_OPTIONS),
+        ("AccountKind", ("StorageV2", "BlobStorage", "FileStorage")),
+        ("AccountTier", ("Standard", "Premium")),
+        ("ReplicationType", ("LRS", "GRS", "RAGRS", "ZRS", "GZRS", "RAGZRS")),
+        ("EnableHTTPSOnly", BOOLEAN_OPTIONS),
+        ("PublicNetworkAccess", ENABLED_DISABLED_OPTIONS),
+        ("TransparentDataEncryption", ENABLED_DISABLED_OPTIONS),
+        ("ZoneRedundant", BOOLEAN_OPTIONS),
+        # Exists fields
+        ("ResourceGroupExists", YN_OPTIONS),
+        ("VNetExists", YN_OPTIONS),
+        ("SubnetExists", YN_OPTIONS),
+        ("NSGExists", YN_OPTIONS),
+        # Public IP
+        ("AllocationMethod", ("Static", "Dynamic")),
+        ("SKU", ("Basic", "Standard")),
+        ("IPVersion", ("IPv4", "IPv6")),
+        ("AvailabilityZone", ("1", "2", "3", "Zone-Redundant", "No-Zone")),
+        # NAT Gateway
+        ("PublicIPExists", YN_OPTIONS),
+        # Load Balancer
+        ("HealthProbeProtocol", ("Tcp", "Http", "Https")),
+        ("LBRuleProtocol", ("Tcp", "Udp", "All")),
+        ("PrivateIPAddressAllocation", ("Dynamic", "Static")),
+        ("LBRuleEnableFloatingIP", BOOLEAN_OPTIONS),
+        ("LBRuleDisableOutboundSnat", BOOLEAN_OPTIONS),
+    )
+    DROPDOWNS_BY_PROVIDER = {"AWS": AWS_DROPDOWNS, "Azure": AZURE_DROPDOWNS}
 
     # Resource Definitions
     AWS_RESOURCES = {
@@ -967,7 +1072,9 @@ class ExcelGeneratorService:
             Bytes content of the Excel file
         """
         output = io.BytesIO()
-        workbook = xlsxwriter.Workbook(output)
+        # Rows are written strictly top-to-bottom, so each row can be flushed
+        # as soon as the next one starts instead of buffering every cell.
+        workbook = xlsxwriter.Workbook(output, self.WORKBOOK_OPTIONS)
 
         # Formats
         header_format = workbook.add_format(
@@ -1156,356 +1263,56 @@ class ExcelGeneratorService:
             sheet.write(1, col_idx, sample_value, sample_data_format)
 
         # Add Data Validations (Dropdowns)
-        # Note: xlsxwriter applies validation to a range. applying to rows 2-1000 (row 1 is sample)
+        # Note: xlsxwriter applies validation to a range. Applying from row 3 to the
+        # end of the column (row 1 is the header, row 2 is sample data)
+
+        col_index = {name: idx for idx, name in enumerate(columns)}
 
         # Environment
         self._add_dropdown(
-            sheet, columns, "Environment", self.ENVIRONMENTS, start_row=2
+            sheet, col_index, ["Environment"], self.ENVIRONMENTS, start_row=2
         )
 
         # Cloud specific validations
-        if "AWS" in sheet_name:
-            self._add_dropdown(sheet, columns, "Region", self.AWS_REGIONS, start_row=2)
-            self._add_dropdown(
-                sheet, columns, "AssociatePublicIP", self.BOOLEAN_OPTIONS, start_row=2
-            )
-            self._add_dropdown(
-                sheet, columns, "EnableDNSHostnames", self.BOOLEAN_OPTIONS, start_row=2
-            )
-            self._add_dropdown(
-                sheet, columns, "EnableDNSSupport", self.BOOLEAN_OPTIONS, start_row=2
-            )
-            self._add_dropdown(
-                sheet, columns, "MapPublicIP", self.BOOLEAN_OPTIONS, start_row=2
-            )
-            self._add_dropdown(
-                sheet, columns, "Versioning", ["Enabled", "Suspended"], start_row=2
-            )
-            self._add_dropdown(
-                sheet, columns, "BlockPublicAccess", self.BOOLEAN_OPTIONS, start_row=2
-            )
-            self._add_dropdown(
-                sheet, columns, "MultiAZ", self.BOOLEAN_OPTIONS, start_row=2
-            )
-            self._add_dropdown(
-                sheet, columns, "PubliclyAccessible", self.BOOLEAN_OPTIONS, start_row=2
-            )
-            self._add_dropdown(
-                sheet, columns, "StorageEncrypted", self.BOOLEAN_OPTIONS, start_row=2
-            )
-            self._add_dropdown(
-                sheet, columns, "DeletionProtection", self.BOOLEAN_OPTIONS, start_row=2
-            )
-            self._add_dropdown(
-                sheet, columns, "SubnetType", ["Public", "Private"], start_row=2
-            )
-            # Add Exists fields dropdowns for AWS resources
-            self._add_dropdown(sheet, columns, "VPCExists", ["y", "n"], start_row=2)
-            self._add_dropdown(sheet, columns, "SubnetExists", ["y", "n"], start_row=2)
-            self._add_dropdown(
-                sheet, columns, "SecurityGroupsExist", ["y", "n"], start_row=2
-            )
-            # Internet Gateway and NAT Gateway specific dropdowns
-            self._add_dropdown(
-                sheet, columns, "InternetGatewayExists", ["y", "n"], start_row=2
-            )
-            self._add_dropdown(
-                sheet, columns, "ConnectivityType", ["public", "private"], start_row=2
-            )
-            # Elastic IP specific dropdowns
-            self._add_dropdown(
-                sheet, columns, "Domain", ["vpc", "standard"], start_row=2
-            )
-            self._add_dropdown(
-                sheet, columns, "InstanceExists", ["y", "n"], start_row=2
-            )
-            self._add_dropdown(
-                sheet, columns, "NetworkInterfaceExists", ["y", "n"], start_row=2
-            )
-            # Load Balancer specific dropdowns
-            self._add_dropdown(
-                sheet, columns, "Type", ["application", "network"], start_row=2
-            )
-            self._add_dropdown(
-                sheet, columns, "Scheme", ["internet-facing", "internal"], start_row=2
-            )
-            self._add_dropdown(
-                sheet, columns, "IPAddressType", ["ipv4", "dualstack"], start_row=2
-            )
-            self._add_dropdown(
-                sheet, columns, "CrossZoneEnabled", self.BOOLEAN_OPTIONS, start_row=2
-            )
-            self._add_dropdown(
-                sheet, columns, "SecurityGroupsExist", ["y", "n"], start_row=2
-            )
-            self._add_dropdown(
-                sheet,
-                columns,
-                "ListenerProtocol",
-                ["HTTP", "HTTPS", "TCP", "UDP", "TLS"],
-                start_row=2,
-            )
-            self._add_dropdown(
-                sheet, columns, "ListenerTargetGroupExists", ["y", "n"], start_row=2
-            )
-            # Target Group specific dropdowns
-            self._add_dropdown(
-                sheet,
-                columns,
-                "Protocol",
-                ["HTTP", "HTTPS", "TCP", "UDP", "TLS", "GENEVE"],
-                start_row=2,
-            )
-            self._add_dropdown(
-                sheet,
-                columns,
-                "TargetType",
-                ["instance", "ip", "lambda", "alb"],
-                start_row=2,
-            )
-            self._add_dropdown(
-                sheet,
-                columns,
-                "HealthCheckProtocol",
-                ["HTTP", "HTTPS", "TCP"],
-                start_row=2,
-            )
-            self._add_dropdown(
-                sheet, columns, "StickinessEnabled", self.BOOLEAN_OPTIONS, start_row=2
-            )
-            self._add_dropdown(
-                sheet,
-                columns,
-                "StickinessType",
-                ["lb_cookie", "app_cookie"],
-                start_row=2,
-            )
+        provider = self._classify_sheet(sheet_name)
+        dropdowns = self.DROPDOWNS_BY_PROVIDER.get(provider, ())
 
-        elif "Azure" in sheet_name:
-            self._add_dropdown(
-                sheet, columns, "Location", self.AZURE_REGIONS, start_row=2
-            )
-            self._add_dropdown(
-                sheet, columns, "OSType", ["Linux", "Windows"], start_row=2
-            )
-            self._add_dropdown(
-                sheet, columns, "AuthenticationType", ["Password", "SSH"], start_row=2
-            )
-            self._add_dropdown(
-                sheet,
-                columns,
-                "OSDiskType",
-                ["StandardSSD_LRS", "Premium_LRS", "Standard_LRS"],
-                start_row=2,
-            )
-            self._add_dropdown(
-                sheet, columns, "AssignPublicIP", self.BOOLEAN_OPTIONS, start_row=2
-            )
-            self._add_dropdown(
-                sheet,
-                columns,
-                "AccountKind",
-                ["StorageV2", "BlobStorage", "FileStorage"],
-                start_row=2,
-            )
-            self._add_dropdown(
-                sheet, columns, "AccountTier", ["Standard", "Premium"], start_row=2
-            )
-            self._add_dropdown(
-                sheet,
-                columns,
-                "ReplicationType",
-                ["LRS", "GRS", "RAGRS", "ZRS", "GZRS", "RAGZRS"],
-                start_row=2,
-            )
-            self._add_dropdown(
-                sheet, columns, "EnableHTTPSOnly", self.BOOLEAN_OPTIONS, start_row=2
-            )
-            self._add_dropdown(
-                sheet,
-                columns,
-                "PublicNetworkAccess",
-                ["Enabled", "Disabled"],
-                start_row=2,
-            )
-            self._add_dropdown(
-                sheet,
-                columns,
-                "TransparentDataEncryption",
-                ["Enabled", "Disabled"],
-                start_row=2,
-            )
-            self._add_dropdown(
-                sheet, columns, "ZoneRedundant", self.BOOLEAN_OPTIONS, start_row=2
-            )
-            # Add Exists fields dropdowns for Azure resources
-            self._add_dropdown(
-                sheet, columns, "ResourceGroupExists", ["y", "n"], start_row=2
-            )
-            # Add Exists fields dropdowns for Azure resources
-            self._add_dropdown(sheet, columns, "VNetExists", ["y", "n"], start_row=2)
-            self._add_dropdown(sheet, columns, "SubnetExists", ["y", "n"], start_row=2)
-            self._add_dropdown(sheet, columns, "NSGExists", ["y", "n"], start_row=2)
-            # Public IP specific dropdowns
-            self._add_dropdown(
-                sheet, columns, "AllocationMethod", ["Static", "Dynamic"], start_row=2
-            )
-            self._add_dropdown(
-                sheet, columns, "SKU", ["Basic", "Standard"], start_row=2
-            )
-            self._add_dropdown(
-                sheet, columns, "IPVersion", ["IPv4", "IPv6"], start_row=2
-            )
-            self._add_dropdown(
-                sheet,
-                columns,
-                "AvailabilityZone",
-                ["1", "2", "3", "Zone-Redundant", "No-Zone"],
-                start_row=2,
-            )
-            # NAT Gateway specific dropdowns
-            self._add_dropdown(
-                sheet, columns, "PublicIPExists", ["y", "n"], start_row=2
-            )
-            # Load Balancer specific dropdowns
-            self._add_dropdown(
-                sheet,
-                columns,
-                "HealthProbeProtocol",
-                ["Tcp", "Http", "Https"],
-                start_row=2,
-            )
-            self._add_dropdown(
-                sheet, columns, "LBRuleProtocol", ["Tcp", "Udp", "All"], start_row=2
-            )
-            self._add_dropdown(
-                sheet,
-                columns,
-                "PrivateIPAddressAllocation",
-                ["Dynamic", "Static"],
-                start_row=2,
-            )
-            self._add_dropdown(
-                sheet,
-                columns,
-                "LBRuleEnableFloatingIP",
-                self.BOOLEAN_OPTIONS,
-                start_row=2,
-            )
-            self._add_dropdown(
-                sheet,
-                columns,
-                "LBRuleDisableOutboundSnat",
-                self.BOOLEAN_OPTIONS,
-                start_row=2,
-            )
-            self._add_dropdown(
-                sheet, columns, "EnableDNSHostnames", self.BOOLEAN_OPTIONS, start_row=2
-            )
-            self._add_dropdown(
-                sheet, columns, "EnableDNSSupport", self.BOOLEAN_OPTIONS, start_row=2
-            )
-            self._add_dropdown(
-                sheet, columns, "MapPublicIP", self.BOOLEAN_OPTIONS, start_row=2
-            )
-            self._add_dropdown(
-                sheet, columns, "Versioning", ["Enabled", "Suspended"], start_row=2
-            )
-            self._add_dropdown(
-                sheet, columns, "BlockPublicAccess", self.BOOLEAN_OPTIONS, start_row=2
-            )
-            self._add_dropdown(
-                sheet, columns, "MultiAZ", self.BOOLEAN_OPTIONS, start_row=2
-            )
-            self._add_dropdown(
-                sheet, columns, "PubliclyAccessible", self.BOOLEAN_OPTIONS, start_row=2
-            )
-            self._add_dropdown(
-                sheet, columns, "StorageEncrypted", self.BOOLEAN_OPTIONS, start_row=2
-            )
-            self._add_dropdown(
-                sheet, columns, "DeletionProtection", self.BOOLEAN_OPTIONS, start_row=2
-            )
-            self._add_dropdown(
-                sheet, columns, "SubnetType", ["Public", "Private"], start_row=2
-            )
+        # Only touch the dropdowns whose column exists on this sheet
+        relevant = [(name, opts) for name, opts in dropdowns if name in col_index]
 
-        elif "Azure" in sheet_name:
-            self._add_dropdown(
-                sheet, columns, "Location", self.AZURE_REGIONS, start_row=2
-            )
-            self._add_dropdown(
-                sheet, columns, "OSType", ["Linux", "Windows"], start_row=2
-            )
-            self._add_dropdown(
-                sheet, columns, "AuthenticationType", ["Password", "SSH"], start_row=2
-            )
-            self._add_dropdown(
-                sheet,
-                columns,
-                "OSDiskType",
-                ["StandardSSD_LRS", "Premium_LRS", "Standard_LRS"],
-                start_row=2,
-            )
-            self._add_dropdown(
-                sheet, columns, "AssignPublicIP", self.BOOLEAN_OPTIONS, start_row=2
-            )
-            self._add_dropdown(
-                sheet,
-                columns,
-                "AccountKind",
-                ["StorageV2", "BlobStorage", "FileStorage"],
-                start_row=2,
-            )
-            self._add_dropdown(
-                sheet, columns, "AccountTier", ["Standard", "Premium"], start_row=2
-            )
-            self._add_dropdown(
-                sheet,
-                columns,
-                "ReplicationType",
-                ["LRS", "GRS", "RAGRS", "ZRS", "GZRS", "RAGZRS"],
-                start_row=2,
-            )
-            self._add_dropdown(
-                sheet, columns, "EnableHTTPSOnly", self.BOOLEAN_OPTIONS, start_row=2
-            )
-            self._add_dropdown(
-                sheet,
-                columns,
-                "PublicNetworkAccess",
-                ["Enabled", "Disabled"],
-                start_row=2,
-            )
-            self._add_dropdown(
-                sheet,
-                columns,
-                "TransparentDataEncryption",
-                ["Enabled", "Disabled"],
-                start_row=2,
-            )
-            self._add_dropdown(
-                sheet, columns, "ZoneRedundant", self.BOOLEAN_OPTIONS, start_row=2
-            )
-            self._add_dropdown(
-                sheet, columns, "ResourceGroupExists", ["y", "n"], start_row=2
-            )
-            # Add Exists fields dropdowns for Azure resources
-            self._add_dropdown(sheet, columns, "VNetExists", ["y", "n"], start_row=2)
-            self._add_dropdown(sheet, columns, "SubnetExists", ["y", "n"], start_row=2)
-            self._add_dropdown(sheet, columns, "NSGExists", ["y", "n"], start_row=2)
+        # Columns sharing an option set get a single multi-range validation
+        grouped = {}
+        for col_name, options in relevant:
+            grouped.setdefault(options, []).append(col_name)
+        for options, col_names in grouped.items():
+            self._add_dropdown(sheet, col_index, col_names, options, start_row=2)
 
-    def _add_dropdown(self, sheet, columns, col_name, options, start_row=1):
-        """Helper to add dropdown validation to a column."""
-        try:
-            col_idx = columns.index(col_name)
-            sheet.data_validation(
-                start_row,
-                col_idx,
-                1000,
-                col_idx,
-                {"validate": "list", "source": options},
-            )
-        except ValueError:
-            # Column not found in this sheet
-            pass
+    def _classify_sheet(self, sheet_name):
+        """Return the cloud provider a sheet belongs to, or None."""
+        return next(
+            (p for p in self.DROPDOWNS_BY_PROVIDER if p in sheet_name), None
+        )
+
+    def _add_dropdown(self, sheet, col_index, col_names, options, start_row=1):
+        """Helper to add one dropdown validation covering the given columns."""
+        # Columns not found in this sheet are skipped
+        col_indices = [col_index[name] for name in col_names if name in col_index]
+        if not col_indices:
+            return
+
+        first_col = col_indices[0]
+        multi_range = " ".join(
+            xl_range(start_row, col_idx, EXCEL_MAX_ROW, col_idx)
+            for col_idx in col_indices
+        )
+        sheet.data_validation(
+            start_row,
+            first_col,
+            EXCEL_MAX_ROW,
+            first_col,
+            {
+                "validate": "list",
+                "source": _list_source(options),
+                "multi_range": multi_range,
+            },
+        )
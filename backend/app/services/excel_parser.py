@@ -1,10 +1,16 @@
 """Excel parsing service for resource definitions."""
 
+import contextlib
+import functools
 import io
+import ipaddress
+import json
+import multiprocessing
+import os
 import re
-from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Callable, Collection, Iterator, Optional, Tuple
 from openpyxl import load_workbook
-from openpyxl.worksheet.worksheet import Worksheet
 
 from app.schemas import (
     ResourceInfo,
@@ -12,36 +18,126 @@ from app.schemas import (
     CloudPlatform,
 )
 
+# Text values recognised as booleans in resource cells
+_TRUE_STRS = frozenset({"true", "yes", "1"})
+_FALSE_STRS = frozenset({"false", "no", "0"})
+
+# Separator for comma-separated list cells; swallows the spaces around commas
+_LIST_SPLIT = re.compile(r"\s*,\s*")
+
+# Allowed values of the fixed-choice resource fields checked by the validators
+_TRUE_FALSE = frozenset({"true", "false"})
+_NAT_CONNECTIVITY_TYPES = frozenset({"public", "private"})
+_EIP_DOMAINS = frozenset({"vpc", "standard"})
+_LB_TYPES = frozenset({"application", "network"})
+_LB_SCHEMES = frozenset({"internet-facing", "internal"})
+_LB_IP_ADDRESS_TYPES = frozenset({"ipv4", "dualstack"})
+_LB_LISTENER_PROTOCOLS = frozenset({"HTTP", "HTTPS", "TCP", "UDP", "TLS"})
+_TG_PROTOCOLS = frozenset({"HTTP", "HTTPS", "TCP", "UDP", "TLS", "GENEVE"})
+_TG_TARGET_TYPES = frozenset({"instance", "ip", "lambda", "alb"})
+_TG_HEALTH_CHECK_PROTOCOLS = frozenset({"HTTP", "HTTPS", "TCP"})
+
+# Inclusive (field, min, max) bounds of the numeric target group settings
+_TG_NUMERIC_RANGES = (
+    ("HealthCheckInterval", 5, 300),
+    ("HealthyThreshold", 2, 10),
+    ("UnhealthyThreshold", 2, 10),
+    ("HealthCheckTimeout", 2, 120),
+    ("DeregistrationDelay", 0, 3600),
+    ("SlowStart", 30, 900),
+)
+
+# Characters a number can start with besides non-ASCII decimal digits
+_NUMBER_START_CHARS = frozenset("+-.0123456789")
+
+# Characters a JSON document can start with; anything else cannot parse.
+# json.loads also accepts NaN and Infinity.
+_JSON_START_CHARS = frozenset('{["-0123456789tfnIN')
+
+# Shape of an IPv4 CIDR block; octet ranges are checked by ipaddress
+_CIDR_RE = re.compile(r"[0-9]{1,3}(?:\.[0-9]{1,3}){3}/(?:3[0-2]|[12][0-9]|[0-9])")
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_ipv4_cidr(value: str) -> bool:
+    """Return True if value is an IPv4 CIDR block such as 10.0.0.0/16."""
+    if _CIDR_RE.fullmatch(value) is None:
+        return False
+    try:
+        ipaddress.IPv4Network(value, strict=False)
+    except ValueError:
+        return False
+    return True
+
+
+def _is_choice(value: Any, choices: Collection[str]) -> bool:
+    """Return True if value is one of choices; non-string values never are."""
+    return isinstance(value, str) and value in choices
+
+
+def _as_int(value: Any) -> Optional[int]:
+    """Return int(value), or None where int() would raise ValueError/TypeError."""
+    # Cells typed as numbers by openpyxl need no conversion
+    if type(value) is int:
+        return value
+    # Text that cannot start a number is rejected without raising
+    if isinstance(value, str):
+        first = value.lstrip()[:1]
+        if not (first in _NUMBER_START_CHARS or first.isdecimal()):
+            return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _format_choices(values: Tuple[str, ...]) -> str:
+    """Format allowed values as "'a' or 'b'" or "'a', 'b', or 'c'"."""
+    quoted = [f"'{value}'" for value in values]
+    if len(quoted) < 3:
+        return " or ".join(quoted)
+    return ", ".join(quoted[:-1]) + ", or " + quoted[-1]
+
 
 class ExcelParserService:
     """Service for parsing Excel files containing resource definitions."""
 
     # Supported resource types for each cloud platform
-    AWS_RESOURCE_TYPES = [
-        "AWS_EC2",
-        "AWS_VPC",
-        "AWS_Subnet",
-        "AWS_SecurityGroup",
-        "AWS_S3",
-        "AWS_RDS",
-        "AWS_InternetGateway",
-        "AWS_NATGateway",
-        "AWS_ElasticIP",
-        "AWS_LoadBalancer",
-        "AWS_TargetGroup",
-    ]
+    AWS_RESOURCE_TYPES = frozenset(
+        {
+            "AWS_EC2",
+            "AWS_VPC",
+            "AWS_Subnet",
+            "AWS_SecurityGroup",
+            "AWS_S3",
+            "AWS_RDS",
+            "AWS_InternetGateway",
+            "AWS_NATGateway",
+            "AWS_ElasticIP",
+            "AWS_LoadBalancer",
+            "AWS_TargetGroup",
+        }
+    )
+
+    AZURE_RESOURCE_TYPES = frozenset(
+        {
+            "Azure_VM",
+            "Azure_VNet",
+            "Azure_Subnet",
+            "Azure_NSG",
+            "Azure_Storage",
+            "Azure_SQL",
+            "Azure_PublicIP",
+            "Azure_NATGateway",
+            "Azure_LoadBalancer",
+        }
+    )
 
-    AZURE_RESOURCE_TYPES = [
-        "Azure_VM",
-        "Azure_VNet",
-        "Azure_Subnet",
-        "Azure_NSG",
-        "Azure_Storage",
-        "Azure_SQL",
-        "Azure_PublicIP",
-        "Azure_NATGateway",
-        "Azure_LoadBalancer",
-    ]
+    # Cloud platform of every resource sheet; other sheets are not parsed
+    SHEET_PLATFORMS: Dict[str, CloudPlatform] = {
+        **dict.fromkeys(AWS_RESOURCE_TYPES, CloudPlatform.AWS),
+        **dict.fromkeys(AZURE_RESOURCE_TYPES, CloudPlatform.AZURE),
+    }
 
     # Common fields for all resources
     COMMON_FIELDS = [
@@ -53,6 +149,190 @@ class ExcelParserService:
         "Tags",
     ]
 
+    # Metadata columns merged into Tags, in tag order
+    METADATA_TAG_FIELDS = ("Environment", "Project", "Owner", "CostCenter")
+
+    # Columns whose values are coerced to lists (comma-separated input allowed)
+    LIST_HEADERS = frozenset(
+        {
+            "Subnets",
+            "SecurityGroups",
+            "SecurityGroupIds",
+            "AddressSpace",
+            "DnsServers",
+            "ServiceEndpoints",
+            "BlobContainers",
+            "Targets",
+            "BackendPoolResources",
+        }
+    )
+
+    # Columns whose values are parsed as JSON
+    JSON_HEADERS = frozenset(
+        {
+            "Tags",
+            "IngressRules",
+            "EgressRules",
+            "SecurityRules",
+            "DataDisks",
+            "LifecycleRules",
+            "BlobContainers",
+            "NetworkRules",
+            "FirewallRules",
+            "VirtualNetworkRules",
+            "LongTermRetention",
+        }
+    )
+
+    # Common fields every resource must fill in
+    REQUIRED_COMMON_FIELDS = ("ResourceName", "Environment", "Project")
+
+    # Per-type AWS fields that must be filled in, in reporting order
+    AWS_REQUIRED_FIELDS: Dict[str, Tuple[str, ...]] = {
+        "EC2": (
+            "Region",
+            "InstanceType",
+            "AMI_ID",
+            "VPC",
+            "VPCExists",
+            "Subnet",
+            "SubnetExists",
+            "SecurityGroups",
+            "SecurityGroupsExist",
+            "KeyPairName",
+        ),
+        "VPC": ("Region", "CIDR_Block"),
+        "Subnet": ("VPC", "VPCExists", "AvailabilityZone", "CIDR_Block"),
+        "SecurityGroup": ("VPC", "VPCExists", "Description", "IngressRules"),
+        "S3": ("Region", "Versioning", "Encryption"),
+        "RDS": (
+            "Region",
+            "Engine",
+            "InstanceClass",
+            "AllocatedStorage",
+            "DBName",
+            "MasterUsername",
+            "VPC",
+            "VPCExists",
+            "SecurityGroups",
+            "SecurityGroupsExist",
+        ),
+        "InternetGateway": ("Region", "VPC", "VPCExists"),
+        "NATGateway": ("Region", "Subnet", "SubnetExists"),
+        "ElasticIP": ("Region",),
+        "LoadBalancer": ("Region", "Type", "Scheme", "VPC", "VPCExists"),
+        "TargetGroup": ("Region", "Port", "Protocol", "VPC", "VPCExists", "TargetType"),
+    }
+
+    # Per-type Azure fields that must be filled in, in reporting order
+    AZURE_REQUIRED_FIELDS: Dict[str, Tuple[str, ...]] = {
+        "VM": (
+            "ResourceGroup",
+            "ResourceGroupExists",
+            "VNet",
+            "VNetExists",
+            "Subnet",
+            "SubnetExists",
+            "NSG",
+            "NSGExists",
+            "Location",
+            "VMSize",
+            "OSType",
+            "AdminUsername",
+        ),
+        "VNet": ("ResourceGroup", "ResourceGroupExists", "Location", "AddressSpace"),
+        "Subnet": (
+            "ResourceGroup",
+            "ResourceGroupExists",
+            "VNet",
+            "VNetExists",
+            "AddressPrefix",
+        ),
+        "NSG": ("ResourceGroup", "ResourceGroupExists", "Location", "SecurityRules"),
+        "Storage": (
+            "ResourceGroup",
+            "ResourceGroupExists",
+            "Location",
+            "AccountKind",
+            "AccountTier",
+            "ReplicationType",
+        ),
+        "SQL": (
+            "ResourceGroup",
+            "ResourceGroupExists",
+            "Location",
+            "ServerName",
+            "ServerAdminLogin",
+            "DatabaseEdition",
+            "VNet",
+            "VNetExists",
+            "Subnet",
+            "SubnetExists",
+        ),
+        "PublicIP": (
+            "ResourceGroup",
+            "ResourceGroupExists",
+            "Location",
+            "AllocationMethod",
+            "SKU",
+        ),
+        "NATGateway": ("ResourceGroup", "ResourceGroupExists", "Location"),
+        "LoadBalancer": (
+            "ResourceGroup",
+            "ResourceGroupExists",
+            "Location",
+            "SKU",
+            "FrontendIPName",
+        ),
+    }
+
+    # Per-type AWS "...Exists" flags, which must be 'y' or 'n' when given
+    AWS_EXISTS_FIELDS: Dict[str, Tuple[str, ...]] = {
+        "EC2": ("VPCExists", "SubnetExists", "SecurityGroupsExist"),
+        "Subnet": ("VPCExists",),
+        "SecurityGroup": ("VPCExists",),
+        "RDS": ("VPCExists", "SecurityGroupsExist"),
+        "InternetGateway": ("VPCExists",),
+        "NATGateway": ("SubnetExists", "InternetGatewayExists"),
+        "ElasticIP": ("InstanceExists", "NetworkInterfaceExists"),
+        "LoadBalancer": (
+            "VPCExists",
+            "SubnetExists",
+            "SecurityGroupsExist",
+            "ListenerTargetGroupExists",
+        ),
+        "TargetGroup": ("VPCExists",),
+    }
+
+    # Per-type Azure "...Exists" flags, which must be 'y' or 'n' when given
+    AZURE_EXISTS_FIELDS: Dict[str, Tuple[str, ...]] = {
+        "VM": ("ResourceGroupExists", "VNetExists", "SubnetExists", "NSGExists"),
+        "VNet": ("ResourceGroupExists",),
+        "Subnet": ("ResourceGroupExists", "VNetExists"),
+        "NSG": ("ResourceGroupExists",),
+        "Storage": ("ResourceGroupExists",),
+        "SQL": ("ResourceGroupExists", "VNetExists", "SubnetExists"),
+        "PublicIP": ("ResourceGroupExists",),
+        "NATGateway": ("ResourceGroupExists", "PublicIPExists", "SubnetExists"),
+        "LoadBalancer": ("ResourceGroupExists", "PublicIPExists", "SubnetExists"),
+    }
+
+    # Per-type Azure fields restricted to a fixed set of values when given
+    AZURE_ENUM_FIELDS: Dict[str, Tuple[Tuple[str, Tuple[str, ...]], ...]] = {
+        "PublicIP": (
+            ("AllocationMethod", ("Static", "Dynamic")),
+            ("SKU", ("Basic", "Standard")),
+        ),
+        "LoadBalancer": (
+            ("SKU", ("Basic", "Standard")),
+            ("HealthProbeProtocol", ("Tcp", "Http", "Https")),
+            ("LBRuleProtocol", ("Tcp", "Udp", "All")),
+        ),
+    }
+
+    # Workbooks at least this large parse their sheets in worker processes
+    PARALLEL_PARSE_MIN_BYTES = 2 * 1024 * 1024
+
     def __init__(self):
         """Initialize Excel parser service."""
         self.errors: List[str] = []
@@ -72,38 +352,25 @@ class ExcelParserService:
         self.warnings = []
 
         try:
-            # Load workbook from bytes
-            workbook = load_workbook(io.BytesIO(file_content), data_only=True)
-
             # Parse all resource sheets
             resources: List[ResourceInfo] = []
             resource_types: List[str] = []
 
-            for sheet_name in workbook.sheetnames:
-                # Skip README and other non-resource sheets
-                if sheet_name.upper() == "README" or not self._is_resource_sheet(
-                    sheet_name
-                ):
-                    continue
-
-                sheet = workbook[sheet_name]
-                cloud_platform = self._get_cloud_platform(sheet_name)
-
-                if not cloud_platform:
-                    self.warnings.append(f"Skipping unknown sheet: {sheet_name}")
-                    continue
-
-                # Parse resources from this sheet
-                sheet_resources = self._parse_resource_sheet(
-                    sheet, sheet_name, cloud_platform
-                )
+            # Large workbooks spread their sheets over worker processes
+            if len(file_content) >= self.PARALLEL_PARSE_MIN_BYTES:
+                parsed_sheets = self._parse_sheets_in_processes(file_content)
+            else:
+                parsed_sheets = self._parse_sheets(file_content)
 
+            for sheet_name, sheet_resources in parsed_sheets:
                 if sheet_resources:
                     resources.extend(sheet_resources)
                     if sheet_name not in resource_types:
                         resource_types.append(sheet_name)
 
-            return ExcelParseResult(
+            # The resources were built by this parser, so skip re-validating
+            # every one of them
+            return ExcelParseResult.model_construct(
                 success=len(self.errors) == 0,
                 resource_count=len(resources),
                 resource_types=resource_types,
@@ -123,6 +390,143 @@ class ExcelParserService:
                 warnings=None,
             )
 
+    def iter_parse_excel_file(self, file_content: bytes) -> Iterator[ResourceInfo]:
+        """
+        Parse Excel file and yield resource definitions as they are read.
+
+        Unlike parse_excel_file, resources are handed out row by row while the
+        workbook is streamed, so callers that process them one at a time never
+        hold the whole list. Errors and warnings are collected on the errors
+        and warnings attributes and are complete once the iterator is
+        exhausted; an unreadable file raises instead of being reported.
+
+        Args:
+            file_content: Excel file content as bytes
+
+        Yields:
+            Parsed resources in workbook order
+        """
+        self.errors = []
+        self.warnings = []
+
+        for sheet_name, rows in self._iter_workbook_sheets(file_content):
+            cloud_platform = self._get_sheet_platform(sheet_name)
+            if cloud_platform is None:
+                continue
+            yield from self._iter_resource_sheet(rows, sheet_name, cloud_platform)
+
+    def _parse_sheets(
+        self, file_content: bytes
+    ) -> Iterator[Tuple[str, List[ResourceInfo]]]:
+        """
+        Parse the resource sheets of a workbook one after another.
+
+        Args:
+            file_content: Excel file content as bytes
+
+        Yields:
+            Tuple of (sheet_name, parsed resources) in workbook order
+        """
+        for sheet_name, rows in self._iter_workbook_sheets(file_content):
+            cloud_platform = self._get_sheet_platform(sheet_name)
+            if cloud_platform is None:
+                continue
+            yield (
+                sheet_name,
+                self._parse_resource_sheet(rows, sheet_name, cloud_platform),
+            )
+
+    def _parse_sheets_in_processes(
+        self, file_content: bytes
+    ) -> List[Tuple[str, List[ResourceInfo]]]:
+        """
+        Parse the resource sheets of a workbook in parallel worker processes.
+
+        Each worker opens its own read-only copy of the workbook and parses
+        one sheet at a time. Results, errors and warnings are merged back in
+        workbook order, so the outcome matches _parse_sheets.
+
+        Args:
+            file_content: Excel file content as bytes
+
+        Returns:
+            List of (sheet_name, parsed resources) in workbook order
+        """
+        with contextlib.closing(self._iter_workbook_sheets(file_content)) as sheets:
+            sheet_names = [sheet_name for sheet_name, _ in sheets]
+
+        jobs: List[Tuple[str, CloudPlatform]] = []
+        for sheet_name in sheet_names:
+            cloud_platform = self._get_sheet_platform(sheet_name)
+            if cloud_platform is not None:
+                jobs.append((sheet_name, cloud_platform))
+
+        max_workers = min(len(jobs), os.cpu_count() or 1)
+        if max_workers < 2:
+            # One sheet or one CPU is not worth the cost of starting workers
+            outcomes = [_parse_workbook_sheet(file_content, *job) for job in jobs]
+        else:
+            # spawn keeps workers independent of the threads of the server
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_sheet_worker,
+                initargs=(file_content,),
+            ) as executor:
+                outcomes = list(executor.map(_parse_sheet_in_worker, *zip(*jobs)))
+
+        parsed_sheets: List[Tuple[str, List[ResourceInfo]]] = []
+        for (sheet_name, _), (sheet_resources, errors, warnings) in zip(jobs, outcomes):
+            self.errors.extend(errors)
+            self.warnings.extend(warnings)
+            parsed_sheets.append((sheet_name, sheet_resources))
+        return parsed_sheets
+
+    def _iter_workbook_sheets(
+        self, file_content: bytes
+    ) -> Iterator[Tuple[str, Iterator[Tuple[Any, ...]]]]:
+        """
+        Open a workbook and yield its sheets in order.
+
+        This is the only place that knows which reader backs the parser; the
+        rest of the service consumes plain value tuples.
+
+        Args:
+            file_content: Excel file content as bytes
+
+        Yields:
+            Tuple of (sheet_name, row iterator). The first row is the header
+            row and each row is a tuple of raw cell values. Rows are read
+            lazily, so sheets that are skipped are never parsed.
+        """
+        # Load workbook from bytes in streaming (read-only) mode; rows are
+        # consumed top to bottom so the full cell tree is never built.
+        workbook = load_workbook(
+            io.BytesIO(file_content),
+            data_only=True,
+            read_only=True,
+            keep_links=False,
+        )
+        try:
+            # worksheets leaves out chartsheets, which have no rows
+            for worksheet in workbook.worksheets:
+                yield worksheet.title, worksheet.iter_rows(values_only=True)
+        finally:
+            workbook.close()
+
+    def _get_sheet_platform(self, sheet_name: str) -> Optional[CloudPlatform]:
+        """
+        Decide whether a sheet is parsed and for which cloud platform.
+
+        Args:
+            sheet_name: Name of the sheet
+
+        Returns:
+            CloudPlatform of a resource sheet, or None for sheets to skip
+        """
+        # README and other non-resource sheets have no entry
+        return self.SHEET_PLATFORMS.get(sheet_name)
+
     def _is_resource_sheet(self, sheet_name: str) -> bool:
         """
         Check if sheet name represents a resource type.
@@ -138,112 +542,100 @@ class ExcelParserService:
             or sheet_name in self.AZURE_RESOURCE_TYPES
         )
 
-    def _get_cloud_platform(self, sheet_name: str) -> Optional[CloudPlatform]:
+    def _parse_resource_sheet(
+        self,
+        rows: Iterator[Tuple[Any, ...]],
+        sheet_name: str,
+        cloud_platform: CloudPlatform,
+    ) -> List[ResourceInfo]:
         """
-        Determine cloud platform from sheet name.
+        Parse a single resource sheet.
 
         Args:
+            rows: Row value tuples of the sheet, starting with the header row
             sheet_name: Name of the sheet
+            cloud_platform: Cloud platform (AWS or Azure)
 
         Returns:
-            CloudPlatform enum or None
+            List of parsed resources
         """
-        if sheet_name.startswith("AWS_"):
-            return CloudPlatform.AWS
-        elif sheet_name.startswith("Azure_"):
-            return CloudPlatform.AZURE
-        return None
+        return list(self._iter_resource_sheet(rows, sheet_name, cloud_platform))
 
-    def _parse_resource_sheet(
+    def _iter_resource_sheet(
         self,
-        sheet: Worksheet,
+        rows: Iterator[Tuple[Any, ...]],
         sheet_name: str,
         cloud_platform: CloudPlatform,
-    ) -> List[ResourceInfo]:
+    ) -> Iterator[ResourceInfo]:
         """
-        Parse a single resource sheet.
+        Parse a single resource sheet row by row.
 
         Args:
-            sheet: Excel worksheet
+            rows: Row value tuples of the sheet, starting with the header row
             sheet_name: Name of the sheet
             cloud_platform: Cloud platform (AWS or Azure)
 
-        Returns:
-            List of parsed resources
+        Yields:
+            Each parsed resource as soon as its row has been read
         """
-        resources: List[ResourceInfo] = []
-
         # Get header row (first row)
-        headers = []
-        for cell in sheet[1]:
-            if cell.value:
-                # Strip asterisks from required field markers
-                header = str(cell.value).strip().rstrip("*")
-                headers.append(header)
-            else:
-                headers.append("")
+        header_row = next(rows, None)
+        if header_row is None:
+            # Empty sheet, nothing to parse
+            return
+
+        # Strip asterisks from required field markers
+        headers = [
+            str(value).strip().rstrip("*") if value else "" for value in header_row
+        ]
 
         if not headers:
             self.errors.append(f"Sheet {sheet_name}: No headers found")
-            return resources
+            return
 
-        # Parse data rows (starting from row 2)
-        for row_idx, row in enumerate(sheet.iter_rows(min_row=2), start=2):
-            # Skip empty rows
-            if all(cell.value is None for cell in row):
-                continue
+        # Only columns with a header carry data; cells past the last one are ignored
+        active_cols = [(idx, header) for idx, header in enumerate(headers) if header]
+        max_col = active_cols[-1][0] + 1 if active_cols else 0
+        # Column roles are fixed per sheet, so resolve them to indices once
+        name_col = max(
+            (idx for idx, header in active_cols if header == "ResourceName"),
+            default=-1,
+        )
+        converters = [
+            (idx, header, self._get_column_converter(header))
+            for idx, header in active_cols
+        ]
 
+        # Extract resource type from sheet name
+        resource_type = sheet_name.split("_", 1)[1] if "_" in sheet_name else sheet_name
+
+        # Parse data rows (starting from row 2)
+        for row_idx, row in enumerate(rows, start=2):
             # Build resource properties from row
             properties: Dict[str, Any] = {}
-            resource_name: Optional[str] = None
 
-            for col_idx, cell in enumerate(row):
-                if col_idx >= len(headers):
-                    break
+            # Read-only rows may be ragged; pad short ones so every active
+            # column can be indexed directly
+            if len(row) < max_col:
+                row = row + (None,) * (max_col - len(row))
 
-                header = headers[col_idx]
-                if not header:
-                    continue
-
-                value = cell.value
-
-                # Store ResourceName separately
-                if header == "ResourceName":
-                    resource_name = str(value) if value else None
+            for col_idx, header, convert in converters:
+                value = row[col_idx]
 
                 # Store all properties
                 if value is not None:
-                    converted_val = self._convert_cell_value(value, header)
-                    # For list-like fields, ensure they are lists
-                    list_headers = [
-                        "Subnets",
-                        "SecurityGroups",
-                        "SecurityGroupIds",
-                        "AddressSpace",
-                        "DnsServers",
-                        "ServiceEndpoints",
-                        "BlobContainers",
-                        "Targets",
-                        "BackendPoolResources",
-                    ]
-                    if header in list_headers and isinstance(converted_val, str):
-                        # Convert comma-separated string to list
-                        if "," in converted_val:
-                            converted_val = [
-                                x.strip() for x in converted_val.split(",") if x.strip()
-                            ]
-                        else:
-                            converted_val = [converted_val]
-
-                    properties[header] = converted_val
+                    properties[header] = convert(value)
+
+            # Skip rows without a value in any headed column
+            if not properties:
+                continue
+
+            # ResourceName comes from the raw cell, not the converted property
+            name_value = row[name_col] if name_col >= 0 else None
+            resource_name = str(name_value) if name_value else None
 
             # Validate and create resource
             if resource_name:
-                # Extract resource type from sheet name
-                resource_type = (
-                    sheet_name.split("_", 1)[1] if "_" in sheet_name else sheet_name
-                )
-
                 # Inject secure defaults
                 if resource_type == "S3":
                     if "PublicAccess" not in properties:
@@ -277,110 +669,140 @@ class ExcelParserService:
                 # This ensures compliance checks can validate these as tags
                 self._merge_metadata_to_tags(properties)
 
-                resource = ResourceInfo(
+                # Every field is already well-typed here, so skip pydantic validation
+                resource = ResourceInfo.model_construct(
                     resource_type=resource_type,
                     cloud_platform=cloud_platform,
                     resource_name=resource_name,
                     properties=properties,
                 )
-                resources.append(resource)
+                yield resource
             else:
                 self.warnings.append(
                     f"Sheet {sheet_name}, Row {row_idx}: Missing ResourceName, skipping row"
                 )
 
-        return resources
-
-    def _convert_cell_value(self, value: Any, header: str) -> Any:
+    def _get_cell_converter(self, header: str) -> Callable[[Any], Any]:
         """
-        Convert cell value to appropriate Python type.
+        Select the value converter for a column.
+
+        The choice depends only on the header, so sheets resolve it once per
+        column instead of re-checking the header for every cell.
 
         Args:
-            value: Cell value
             header: Column header name
 
         Returns:
-            Converted value
+            Callable converting a non-None cell value
         """
-        # Handle None
-        if value is None:
-            return None
+        # Handle JSON fields (Tags, IngressRules, etc.)
+        if header in self.JSON_HEADERS:
+            return functools.partial(self._convert_json_value, header=header)
+        return self._convert_scalar_value
 
-        # Convert to string first
-        str_value = str(value).strip()
+    def _get_column_converter(self, header: str) -> Callable[[Any], Any]:
+        """
+        Select the converter used for a column of a resource sheet.
 
-        # Handle JSON fields (Tags, IngressRules, etc.)
-        if header in [
-            "Tags",
-            "IngressRules",
-            "EgressRules",
-            "SecurityRules",
-            "DataDisks",
-            "LifecycleRules",
-            "BlobContainers",
-            "NetworkRules",
-            "FirewallRules",
-            "VirtualNetworkRules",
-            "LongTermRetention",
-        ]:
-            # Try to parse as JSON
-            import json
+        List columns wrap the cell converter so that text values become
+        lists; every other column uses the cell converter as is.
+
+        Args:
+            header: Column header name
 
+        Returns:
+            Callable converting a non-None cell value
+        """
+        convert = self._get_cell_converter(header)
+        if header in self.LIST_HEADERS:
+            return functools.partial(self._convert_list_value, convert=convert)
+        return convert
+
+    def _convert_list_value(self, value: Any, convert: Callable[[Any], Any]) -> Any:
+        """Convert a list column value, splitting comma-separated text."""
+        converted = convert(value)
+        if not isinstance(converted, str):
+            return converted
+        if "," in converted:
+            return [item for item in _LIST_SPLIT.split(converted.strip()) if item]
+        return [converted]
+
+    def _convert_json_value(self, value: Any, header: str) -> Any:
+        """Parse a JSON column value, keeping the raw text if it is invalid."""
+        str_value = str(value).strip()
+        # Only text that can start a JSON document is worth handing to
+        # json.loads; plain text fails fast without raising
+        if str_value[:1] in _JSON_START_CHARS:
             try:
                 return json.loads(str_value)
             except json.JSONDecodeError:
-                self.warnings.append(
-                    f"Invalid JSON in field {header}: {str_value[:50]}..."
-                )
-                return str_value
+                pass
+        self.warnings.append(f"Invalid JSON in field {header}: {str_value[:50]}...")
+        return str_value
 
+    def _convert_scalar_value(self, value: Any) -> Any:
+        """Convert a non-JSON cell value to bool, number or stripped string."""
         # Handle boolean fields
         if isinstance(value, bool):
             return value
-        if str_value.lower() in ["true", "yes", "1"]:
-            return True
-        if str_value.lower() in ["false", "no", "0"]:
-            return False
 
-        # Handle numeric fields
+        # Handle numeric fields (already typed by openpyxl). Integer 1/0 keep
+        # the same boolean meaning as the "1"/"0" text values below.
         if isinstance(value, (int, float)):
+            if isinstance(value, int) and value in (0, 1):
+                return value == 1
             return value
 
-        # Try to convert to number
-        try:
-            if "." in str_value:
-                return float(str_value)
-            else:
-                return int(str_value)
-        except ValueError:
-            pass
+        # Convert to string
+        str_value = str(value).strip()
+
+        lowered = str_value.lower()
+        if lowered in _TRUE_STRS:
+            return True
+        if lowered in _FALSE_STRS:
+            return False
+
+        # Try to convert to number. Text that cannot start a number (regions,
+        # names, instance sizes) skips int()/float() and their ValueError.
+        first = str_value[:1]
+        if first in _NUMBER_START_CHARS or first.isdecimal():
+            try:
+                if "." in str_value:
+                    return float(str_value)
+                else:
+                    return int(str_value)
+            except ValueError:
+                pass
 
         # Return as string
         return str_value
 
-    def validate_resource(self, resource: ResourceInfo) -> Tuple[bool, List[str]]:
+    def validate_resource(
+        self, resource: ResourceInfo, fail_fast: bool = False
+    ) -> Tuple[bool, List[str]]:
         """
         Validate a single resource definition.
 
         Args:
             resource: Resource to validate
+            fail_fast: Stop at the first failing check and report only that
+                error, for callers that just need a valid/invalid answer
 
         Returns:
             Tuple of (is_valid, list_of_errors)
         """
-        errors: List[str] = []
-
         # Check required common fields
-        required_common = ["ResourceName", "Environment", "Project"]
-        for field in required_common:
-            if field not in resource.properties or not resource.properties[field]:
-                errors.append(f"Missing required field: {field}")
+        errors = self._missing_fields_errors(
+            self._missing_fields(resource.properties, self.REQUIRED_COMMON_FIELDS)
+        )
+        if fail_fast and errors:
+            return False, errors[:1]
 
         # Validate based on resource type and cloud platform
         if resource.cloud_platform == CloudPlatform.AWS:
-            errors.extend(self._validate_aws_resource(resource))
+            errors.extend(self._validate_aws_resource(resource, fail_fast))
         elif resource.cloud_platform == CloudPlatform.AZURE:
-            errors.extend(self._validate_azure_resource(resource))
+            errors.extend(self._validate_azure_resource(resource, fail_fast))
 
         return len(errors) == 0, errors
 
@@ -439,14 +861,13 @@ class ExcelParserService:
             return
 
         if isinstance(raw_endpoints, str):
-            endpoints = [item.strip() for item in raw_endpoints.split(",") if item.strip()]
+            endpoints = [item for item in _LIST_SPLIT.split(raw_endpoints.strip()) if item]
         elif isinstance(raw_endpoints, list):
             endpoints = [str(item).strip() for item in raw_endpoints if str(item).strip()]
         else:
             endpoints = [str(raw_endpoints).strip()]
 
         removed: List[str] = []
-        mapped_to_sql = False
         kept: List[str] = []
         for endpoint in endpoints:
             normalized = endpoint.lower()
@@ -454,9 +875,9 @@ class ExcelParserService:
                 kept.append("Microsoft.Sql")
             elif normalized.startswith("microsoft.sql/"):
                 removed.append(endpoint)
-                mapped_to_sql = True
             else:
                 kept.append(endpoint)
+        mapped_to_sql = bool(removed)
 
         if removed:
             self.warnings.append(
@@ -524,510 +945,256 @@ class ExcelParserService:
                     "or invalid (expected blob endpoint)."
                 )
 
-    def _validate_aws_resource(self, resource: ResourceInfo) -> List[str]:
-        """Validate AWS-specific resource fields."""
-        errors: List[str] = []
-        props = resource.properties
+    def _validate_aws_resource(
+        self, resource: ResourceInfo, fail_fast: bool = False
+    ) -> List[str]:
+        """Validate AWS-specific resource fields.
 
-        if resource.resource_type == "EC2":
-            required = [
-                "Region",
-                "InstanceType",
-                "AMI_ID",
-                "VPC",
-                "VPCExists",  # New required field
-                "Subnet",
-                "SubnetExists",  # New required field
-                "SecurityGroups",
-                "SecurityGroupsExist",  # New required field
-                "KeyPairName",
-            ]
-            for field in required:
-                if field not in props or not props[field]:
-                    errors.append(f"Missing required field for EC2: {field}")
-            # Validate Exists fields values
-            exists_fields = ["VPCExists", "SubnetExists", "SecurityGroupsExist"]
-            for field in exists_fields:
-                if field in props and props[field] not in ["y", "n"]:
-                    errors.append(f"{field} must be 'y' or 'n'")
-
-        elif resource.resource_type == "VPC":
-            required = ["Region", "CIDR_Block"]
-            for field in required:
-                if field not in props or not props[field]:
-                    errors.append(f"Missing required field for VPC: {field}")
-
-            # Validate CIDR format
-            if "CIDR_Block" in props:
-                if not self._is_valid_cidr(props["CIDR_Block"]):
-                    errors.append(f"Invalid CIDR format: {props['CIDR_Block']}")
-
-        elif resource.resource_type == "Subnet":
-            required = [
-                "VPC",
-                "VPCExists",
-                "AvailabilityZone",
-                "CIDR_Block",
-            ]  # Updated required fields
-            for field in required:
-                if field not in props or not props[field]:
-                    errors.append(f"Missing required field for Subnet: {field}")
-            # Validate VPCExists value
-            if "VPCExists" in props and props["VPCExists"] not in ["y", "n"]:
-                errors.append("VPCExists must be 'y' or 'n'")
-
-        elif resource.resource_type == "SecurityGroup":
-            required = [
-                "VPC",
-                "VPCExists",
-                "Description",
-                "IngressRules",
-            ]  # Updated required fields
-            for field in required:
-                if field not in props or not props[field]:
-                    errors.append(f"Missing required field for SecurityGroup: {field}")
-            # Validate VPCExists value
-            if "VPCExists" in props and props["VPCExists"] not in ["y", "n"]:
-                errors.append("VPCExists must be 'y' or 'n'")
-
-        elif resource.resource_type == "S3":
-            required = ["Region", "Versioning", "Encryption"]
-            for field in required:
-                if field not in props or not props[field]:
-                    errors.append(f"Missing required field for S3: {field}")
-
-        elif resource.resource_type == "RDS":
-            required = [
-                "Region",
-                "Engine",
-                "InstanceClass",
-                "AllocatedStorage",
-                "DBName",
-                "MasterUsername",
-                "VPC",
-                "VPCExists",  # New required field
-                "SecurityGroups",
-                "SecurityGroupsExist",  # New required field
-            ]
-            for field in required:
-                if field not in props or not props[field]:
-                    errors.append(f"Missing required field for RDS: {field}")
-            # Validate Exists fields values
-            exists_fields = ["VPCExists", "SecurityGroupsExist"]
-            for field in exists_fields:
-                if field in props and props[field] not in ["y", "n"]:
-                    errors.append(f"{field} must be 'y' or 'n'")
-
-        elif resource.resource_type == "InternetGateway":
-            required = [
-                "Region",
-                "VPC",
-                "VPCExists",
-            ]
-            for field in required:
-                if field not in props or not props[field]:
-                    errors.append(
-                        f"Missing required field for InternetGateway: {field}"
-                    )
-            # Validate VPCExists value
-            if "VPCExists" in props and props["VPCExists"] not in ["y", "n"]:
-                errors.append("VPCExists must be 'y' or 'n'")
-
-        elif resource.resource_type == "NATGateway":
-            required = [
-                "Region",
-                "Subnet",
-                "SubnetExists",
-            ]
-            for field in required:
-                if field not in props or not props[field]:
-                    errors.append(f"Missing required field for NATGateway: {field}")
-            # Validate Exists fields values
-            exists_fields = ["SubnetExists", "InternetGatewayExists"]
-            for field in exists_fields:
-                if field in props and props[field] not in ["y", "n"]:
-                    errors.append(f"{field} must be 'y' or 'n'")
-            # Validate ConnectivityType if provided
-            if "ConnectivityType" in props:
-                if props["ConnectivityType"] not in ["public", "private"]:
-                    errors.append("ConnectivityType must be 'public' or 'private'")
-
-        elif resource.resource_type == "ElasticIP":
-            required = [
-                "Region",
-            ]
-            for field in required:
-                if field not in props or not props[field]:
-                    errors.append(f"Missing required field for ElasticIP: {field}")
-            # Validate Exists fields values
-            exists_fields = ["InstanceExists", "NetworkInterfaceExists"]
-            for field in exists_fields:
-                if field in props and props[field] not in ["y", "n"]:
-                    errors.append(f"{field} must be 'y' or 'n'")
-            # Validate Domain if provided
-            if "Domain" in props:
-                if props["Domain"] not in ["vpc", "standard"]:
-                    errors.append("Domain must be 'vpc' or 'standard'")
-
-        elif resource.resource_type == "LoadBalancer":
-            required = [
-                "Region",
-                "Type",
-                "Scheme",
-                "VPC",
-                "VPCExists",
-            ]
-            for field in required:
-                if field not in props or not props[field]:
-                    errors.append(f"Missing required field for LoadBalancer: {field}")
-            # Validate Exists fields values
-            exists_fields = [
-                "VPCExists",
-                "SubnetExists",
-                "SecurityGroupsExist",
-                "ListenerTargetGroupExists",
-            ]
-            for field in exists_fields:
-                if field in props and props[field] not in ["y", "n"]:
-                    errors.append(f"{field} must be 'y' or 'n'")
-            # Validate Type
-            if "Type" in props:
-                if props["Type"] not in ["application", "network"]:
-                    errors.append("Type must be 'application' or 'network'")
-            # Validate Scheme
-            if "Scheme" in props:
-                if props["Scheme"] not in ["internet-facing", "internal"]:
-                    errors.append("Scheme must be 'internet-facing' or 'internal'")
-            # Validate IPAddressType if provided
-            if "IPAddressType" in props:
-                if props["IPAddressType"] not in ["ipv4", "dualstack"]:
-                    errors.append("IPAddressType must be 'ipv4' or 'dualstack'")
-            # Validate IdleTimeout for ALB
-            if "IdleTimeout" in props and "Type" in props:
-                if props["Type"] == "application":
-                    try:
-                        timeout = int(props["IdleTimeout"])
-                        if timeout < 1 or timeout > 4000:
-                            errors.append(
-                                "IdleTimeout must be between 1 and 4000 seconds for ALB"
-                            )
-                    except (ValueError, TypeError):
-                        errors.append("IdleTimeout must be a valid integer")
-            # Validate ListenerProtocol if provided
-            if "ListenerProtocol" in props:
-                if props["ListenerProtocol"] not in [
-                    "HTTP",
-                    "HTTPS",
-                    "TCP",
-                    "UDP",
-                    "TLS",
-                ]:
-                    errors.append(
-                        "ListenerProtocol must be 'HTTP', 'HTTPS', 'TCP', 'UDP', or 'TLS'"
-                    )
-            # Validate boolean fields
-            bool_fields = ["CrossZoneEnabled", "DeletionProtection"]
-            for field in bool_fields:
-                if field in props:
-                    val = str(props[field]).lower()
-                    if val not in ["true", "false"]:
-                        errors.append(f"{field} must be 'true' or 'false'")
-
-        elif resource.resource_type == "TargetGroup":
-            required = [
-                "Region",
-                "Port",
-                "Protocol",
-                "VPC",
-                "VPCExists",
-                "TargetType",
-            ]
-            for field in required:
-                if field not in props or not props[field]:
-                    errors.append(f"Missing required field for TargetGroup: {field}")
-            # Validate VPCExists
-            if "VPCExists" in props and props["VPCExists"] not in ["y", "n"]:
-                errors.append("VPCExists must be 'y' or 'n'")
-            # Validate Protocol
-            if "Protocol" in props:
-                if props["Protocol"] not in [
-                    "HTTP",
-                    "HTTPS",
-                    "TCP",
-                    "UDP",
-                    "TLS",
-                    "GENEVE",
-                ]:
-                    errors.append(
-                        "Protocol must be 'HTTP', 'HTTPS', 'TCP', 'UDP', 'TLS', or 'GENEVE'"
-                    )
-            # Validate TargetType
-            if "TargetType" in props:
-                if props["TargetType"] not in ["instance", "ip", "lambda", "alb"]:
-                    errors.append(
-                        "TargetType must be 'instance', 'ip', 'lambda', or 'alb'"
-                    )
-            # Validate Port
-            if "Port" in props:
-                try:
-                    port = int(props["Port"])
-                    if port < 1 or port > 65535:
-                        errors.append("Port must be between 1 and 65535")
-                except (ValueError, TypeError):
-                    errors.append("Port must be a valid integer between 1 and 65535")
-            # Validate HealthCheckProtocol if provided
-            if "HealthCheckProtocol" in props:
-                if props["HealthCheckProtocol"] not in ["HTTP", "HTTPS", "TCP"]:
-                    errors.append(
-                        "HealthCheckProtocol must be 'HTTP', 'HTTPS', or 'TCP'"
-                    )
-            # Validate numeric health check fields
-            numeric_fields = {
-                "HealthCheckInterval": (5, 300),
-                "HealthyThreshold": (2, 10),
-                "UnhealthyThreshold": (2, 10),
-                "HealthCheckTimeout": (2, 120),
-                "DeregistrationDelay": (0, 3600),
-                "SlowStart": (30, 900),
-            }
-            for field, (min_val, max_val) in numeric_fields.items():
-                if field in props:
-                    try:
-                        val = int(props[field])
-                        if val < min_val or val > max_val:
-                            errors.append(
-                                f"{field} must be between {min_val} and {max_val}"
-                            )
-                    except (ValueError, TypeError):
-                        errors.append(f"{field} must be a valid integer")
-            # Validate boolean fields
-            bool_fields = ["StickinessEnabled"]
-            for field in bool_fields:
-                if field in props:
-                    val = str(props[field]).lower()
-                    if val not in ["true", "false"]:
-                        errors.append(f"{field} must be 'true' or 'false'")
+        With ``fail_fast`` the later check groups are skipped once one has
+        failed and only the first error is returned.
+        """
+        resource_type = resource.resource_type
+        props = resource.properties
+        errors = self._missing_fields_errors(
+            self._missing_fields(
+                props, self.AWS_REQUIRED_FIELDS.get(resource_type, ())
+            ),
+            resource_type,
+        )
+        if fail_fast and errors:
+            return errors[:1]
+        errors.extend(
+            f"{field} must be 'y' or 'n'"
+            for field in self._invalid_exists_flags(
+                props, self.AWS_EXISTS_FIELDS.get(resource_type, ())
+            )
+        )
+        if fail_fast and errors:
+            return errors[:1]
+        validator = self._AWS_VALIDATORS.get(resource_type)
+        if validator is not None:
+            errors.extend(validator(self, props))
+        return errors[:1] if fail_fast else errors
+
+    def _validate_azure_resource(
+        self, resource: ResourceInfo, fail_fast: bool = False
+    ) -> List[str]:
+        """Validate Azure-specific resource fields.
+
+        With ``fail_fast`` the later check groups are skipped once one has
+        failed and only the first error is returned.
+        """
+        resource_type = resource.resource_type
+        props = resource.properties
+        errors = self._missing_fields_errors(
+            self._missing_fields(
+                props, self.AZURE_REQUIRED_FIELDS.get(resource_type, ())
+            ),
+            resource_type,
+        )
+        if fail_fast and errors:
+            return errors[:1]
+        errors.extend(
+            f"{field} must be 'y' or 'n'"
+            for field in self._invalid_exists_flags(
+                props, self.AZURE_EXISTS_FIELDS.get(resource_type, ())
+            )
+        )
+        if fail_fast and errors:
+            return errors[:1]
+        for field, allowed in self.AZURE_ENUM_FIELDS.get(resource_type, ()):
+            if field in props and not _is_choice(props[field], allowed):
+                errors.append(f"{field} must be {_format_choices(allowed)}")
+                if fail_fast:
+                    return errors
+        validator = self._AZURE_VALIDATORS.get(resource_type)
+        if validator is not None:
+            errors.extend(validator(self, props))
+        return errors[:1] if fail_fast else errors
+
+    @staticmethod
+    def _invalid_exists_flags(
+        props: Dict[str, Any], fields: Tuple[str, ...]
+    ) -> List[str]:
+        """Return the given ...Exists fields whose value is not 'y' or 'n'."""
+        # Absent fields default to a valid flag so each field costs a single
+        # lookup; the tuple test compares by equality, so unhashable cell
+        # values such as lists cannot raise
+        get = props.get
+        return [field for field in fields if get(field, "n") not in ("y", "n")]
+
+    @staticmethod
+    def _missing_fields_errors(
+        missing: List[str], resource_type: Optional[str] = None
+    ) -> List[str]:
+        """Return a single error naming every missing required field, if any."""
+        if not missing:
+            return []
+        noun = "field" if len(missing) == 1 else "fields"
+        scope = f" for {resource_type}" if resource_type else ""
+        return [f"Missing required {noun}{scope}: {', '.join(missing)}"]
+
+    @staticmethod
+    def _missing_fields(props: Dict[str, Any], required: Tuple[str, ...]) -> List[str]:
+        """Return the required fields that are absent or empty, in order."""
+        get = props.get
+        return [field for field in required if not get(field)]
+
+    def _validate_aws_vpc(self, props: Dict[str, Any]) -> List[str]:
+        """Validate AWS VPC fields."""
+        errors: List[str] = []
+        # Validate CIDR format
+        if "CIDR_Block" in props:
+            if not self._is_valid_cidr(props["CIDR_Block"]):
+                errors.append(f"Invalid CIDR format: {props['CIDR_Block']}")
+        return errors
 
+    def _validate_aws_nat_gateway(self, props: Dict[str, Any]) -> List[str]:
+        """Validate AWS NATGateway fields."""
+        errors: List[str] = []
+        # Validate ConnectivityType if provided
+        if "ConnectivityType" in props:
+            if not _is_choice(props["ConnectivityType"], _NAT_CONNECTIVITY_TYPES):
+                errors.append("ConnectivityType must be 'public' or 'private'")
         return errors
 
-    def _validate_azure_resource(self, resource: ResourceInfo) -> List[str]:
-        """Validate Azure-specific resource fields."""
+    def _validate_aws_elastic_ip(self, props: Dict[str, Any]) -> List[str]:
+        """Validate AWS ElasticIP fields."""
         errors: List[str] = []
-        props = resource.properties
+        # Validate Domain if provided
+        if "Domain" in props:
+            if not _is_choice(props["Domain"], _EIP_DOMAINS):
+                errors.append("Domain must be 'vpc' or 'standard'")
+        return errors
 
-        if resource.resource_type == "VM":
-            required = [
-                "ResourceGroup",
-                "ResourceGroupExists",  # New required field
-                "VNet",
-                "VNetExists",  # New required field
-                "Subnet",
-                "SubnetExists",  # New required field
-                "NSG",
-                "NSGExists",  # New required field
-                "Location",
-                "VMSize",
-                "OSType",
-                "AdminUsername",
-            ]
-            for field in required:
-                if field not in props or not props[field]:
-                    errors.append(f"Missing required field for VM: {field}")
-            # Validate Exists fields values
-            exists_fields = [
-                "ResourceGroupExists",
-                "VNetExists",
-                "SubnetExists",
-                "NSGExists",
-            ]
-            for field in exists_fields:
-                if field in props and props[field] not in ["y", "n"]:
-                    errors.append(f"{field} must be 'y' or 'n'")
-
-        elif resource.resource_type == "VNet":
-            required = [
-                "ResourceGroup",
-                "ResourceGroupExists",
-                "Location",
-                "AddressSpace",
-            ]  # Updated required fields
-            for field in required:
-                if field not in props or not props[field]:
-                    errors.append(f"Missing required field for VNet: {field}")
-            # Validate ResourceGroupExists value
-            if "ResourceGroupExists" in props and props["ResourceGroupExists"] not in [
-                "y",
-                "n",
-            ]:
-                errors.append("ResourceGroupExists must be 'y' or 'n'")
-
-        elif resource.resource_type == "Subnet":
-            required = [
-                "ResourceGroup",
-                "ResourceGroupExists",
-                "VNet",
-                "VNetExists",
-                "AddressPrefix",
-            ]
-            for field in required:
-                if field not in props or not props[field]:
-                    errors.append(f"Missing required field for Subnet: {field}")
-            # Validate Exists field values
-            exists_fields = ["ResourceGroupExists", "VNetExists"]
-            for field in exists_fields:
-                if field in props and props[field] not in ["y", "n"]:
-                    errors.append(f"{field} must be 'y' or 'n'")
-
-        elif resource.resource_type == "NSG":
-            required = [
-                "ResourceGroup",
-                "ResourceGroupExists",
-                "Location",
-                "SecurityRules",
-            ]  # Updated required fields
-            for field in required:
-                if field not in props or not props[field]:
-                    errors.append(f"Missing required field for NSG: {field}")
-            # Validate ResourceGroupExists value
-            if "ResourceGroupExists" in props and props["ResourceGroupExists"] not in [
-                "y",
-                "n",
-            ]:
-                errors.append("ResourceGroupExists must be 'y' or 'n'")
-
-        elif resource.resource_type == "Storage":
-            required = [
-                "ResourceGroup",
-                "ResourceGroupExists",  # New required field
-                "Location",
-                "AccountKind",
-                "AccountTier",
-                "ReplicationType",
-            ]
-            for field in required:
-                if field not in props or not props[field]:
-                    errors.append(f"Missing required field for Storage: {field}")
-            # Validate ResourceGroupExists value
-            if "ResourceGroupExists" in props and props["ResourceGroupExists"] not in [
-                "y",
-                "n",
-            ]:
-                errors.append("ResourceGroupExists must be 'y' or 'n'")
-
-        elif resource.resource_type == "SQL":
-            required = [
-                "ResourceGroup",
-                "ResourceGroupExists",  # New required field
-                "Location",
-                "ServerName",
-                "ServerAdminLogin",
-                "DatabaseEdition",
-                "VNet",
-                "VNetExists",  # New required field
-                "Subnet",
-                "SubnetExists",  # New required field
-            ]
-            for field in required:
-                if field not in props or not props[field]:
-                    errors.append(f"Missing required field for SQL: {field}")
-            # Validate Exists fields values
-            exists_fields = ["ResourceGroupExists", "VNetExists", "SubnetExists"]
-            for field in exists_fields:
-                if field in props and props[field] not in ["y", "n"]:
-                    errors.append(f"{field} must be 'y' or 'n'")
-
-        elif resource.resource_type == "PublicIP":
-            required = [
-                "ResourceGroup",
-                "ResourceGroupExists",
-                "Location",
-                "AllocationMethod",
-                "SKU",
-            ]
-            for field in required:
-                if field not in props or not props[field]:
-                    errors.append(f"Missing required field for PublicIP: {field}")
-            # Validate ResourceGroupExists value
-            if "ResourceGroupExists" in props and props["ResourceGroupExists"] not in [
-                "y",
-                "n",
-            ]:
-                errors.append("ResourceGroupExists must be 'y' or 'n'")
-            # Validate AllocationMethod
-            if "AllocationMethod" in props:
-                if props["AllocationMethod"] not in ["Static", "Dynamic"]:
-                    errors.append("AllocationMethod must be 'Static' or 'Dynamic'")
-            # Validate SKU
-            if "SKU" in props:
-                if props["SKU"] not in ["Basic", "Standard"]:
-                    errors.append("SKU must be 'Basic' or 'Standard'")
-
-        elif resource.resource_type == "NATGateway":
-            required = [
-                "ResourceGroup",
-                "ResourceGroupExists",
-                "Location",
-            ]
-            for field in required:
-                if field not in props or not props[field]:
-                    errors.append(f"Missing required field for NATGateway: {field}")
-            # Validate Exists fields values
-            exists_fields = ["ResourceGroupExists", "PublicIPExists", "SubnetExists"]
-            for field in exists_fields:
-                if field in props and props[field] not in ["y", "n"]:
-                    errors.append(f"{field} must be 'y' or 'n'")
-            # Validate IdleTimeoutMinutes if provided
-            if "IdleTimeoutMinutes" in props:
-                timeout = props["IdleTimeoutMinutes"]
-                if isinstance(timeout, (int, float)):
-                    if timeout < 4 or timeout > 120:
-                        errors.append("IdleTimeoutMinutes must be between 4 and 120")
-
-        elif resource.resource_type == "LoadBalancer":
-            required = [
-                "ResourceGroup",
-                "ResourceGroupExists",
-                "Location",
-                "SKU",
-                "FrontendIPName",
-            ]
-            for field in required:
-                if field not in props or not props[field]:
-                    errors.append(f"Missing required field for LoadBalancer: {field}")
-            # Validate Exists fields values
-            exists_fields = ["ResourceGroupExists", "PublicIPExists", "SubnetExists"]
-            for field in exists_fields:
-                if field in props and props[field] not in ["y", "n"]:
-                    errors.append(f"{field} must be 'y' or 'n'")
-            # Validate SKU
-            if "SKU" in props:
-                if props["SKU"] not in ["Basic", "Standard"]:
-                    errors.append("SKU must be 'Basic' or 'Standard'")
-            # Validate HealthProbeProtocol if provided
-            if "HealthProbeProtocol" in props:
-                if props["HealthProbeProtocol"] not in ["Tcp", "Http", "Https"]:
-                    errors.append(
-                        "HealthProbeProtocol must be 'Tcp', 'Http', or 'Https'"
-                    )
-            # Validate LBRuleProtocol if provided
-            if "LBRuleProtocol" in props:
-                if props["LBRuleProtocol"] not in ["Tcp", "Udp", "All"]:
-                    errors.append("LBRuleProtocol must be 'Tcp', 'Udp', or 'All'")
-            # Validate BackendPoolResources if provided
-            if "BackendPoolResources" in props:
-                backend_resources = props["BackendPoolResources"]
-                if not isinstance(backend_resources, list):
-                    errors.append("BackendPoolResources must be a comma-separated list")
-                elif not all(
-                    isinstance(resource_name, str) and resource_name.strip()
-                    for resource_name in backend_resources
-                ):
+    def _validate_aws_load_balancer(self, props: Dict[str, Any]) -> List[str]:
+        """Validate AWS LoadBalancer fields."""
+        errors: List[str] = []
+        # Validate Type
+        if "Type" in props:
+            if not _is_choice(props["Type"], _LB_TYPES):
+                errors.append("Type must be 'application' or 'network'")
+        # Validate Scheme
+        if "Scheme" in props:
+            if not _is_choice(props["Scheme"], _LB_SCHEMES):
+                errors.append("Scheme must be 'internet-facing' or 'internal'")
+        # Validate IPAddressType if provided
+        if "IPAddressType" in props:
+            if not _is_choice(props["IPAddressType"], _LB_IP_ADDRESS_TYPES):
+                errors.append("IPAddressType must be 'ipv4' or 'dualstack'")
+        # Validate IdleTimeout for ALB
+        if "IdleTimeout" in props and "Type" in props:
+            if props["Type"] == "application":
+                timeout = _as_int(props["IdleTimeout"])
+                if timeout is None:
+                    errors.append("IdleTimeout must be a valid integer")
+                elif not 1 <= timeout <= 4000:
                     errors.append(
-                        "BackendPoolResources entries must be non-empty resource names"
+                        "IdleTimeout must be between 1 and 4000 seconds for ALB"
                     )
+        # Validate ListenerProtocol if provided
+        if "ListenerProtocol" in props:
+            if not _is_choice(props["ListenerProtocol"], _LB_LISTENER_PROTOCOLS):
+                errors.append(
+                    "ListenerProtocol must be 'HTTP', 'HTTPS', 'TCP', 'UDP', or 'TLS'"
+                )
+        # Validate boolean fields
+        bool_fields = ["CrossZoneEnabled", "DeletionProtection"]
+        for field in bool_fields:
+            if field in props:
+                val = str(props[field]).lower()
+                if val not in _TRUE_FALSE:
+                    errors.append(f"{field} must be 'true' or 'false'")
+        return errors
+
+    def _validate_aws_target_group(self, props: Dict[str, Any]) -> List[str]:
+        """Validate AWS TargetGroup fields."""
+        errors: List[str] = []
+        # Validate Protocol
+        if "Protocol" in props:
+            if not _is_choice(props["Protocol"], _TG_PROTOCOLS):
+                errors.append(
+                    "Protocol must be 'HTTP', 'HTTPS', 'TCP', 'UDP', 'TLS', or 'GENEVE'"
+                )
+        # Validate TargetType
+        if "TargetType" in props:
+            if not _is_choice(props["TargetType"], _TG_TARGET_TYPES):
+                errors.append("TargetType must be 'instance', 'ip', 'lambda', or 'alb'")
+        # Validate Port
+        if "Port" in props:
+            port = _as_int(props["Port"])
+            if port is None:
+                errors.append("Port must be a valid integer between 1 and 65535")
+            elif not 1 <= port <= 65535:
+                errors.append("Port must be between 1 and 65535")
+        # Validate HealthCheckProtocol if provided
+        if "HealthCheckProtocol" in props:
+            if not _is_choice(props["HealthCheckProtocol"], _TG_HEALTH_CHECK_PROTOCOLS):
+                errors.append("HealthCheckProtocol must be 'HTTP', 'HTTPS', or 'TCP'")
+        # Validate numeric health check fields
+        for field, min_val, max_val in _TG_NUMERIC_RANGES:
+            if field in props:
+                val = _as_int(props[field])
+                if val is None:
+                    errors.append(f"{field} must be a valid integer")
+                elif not min_val <= val <= max_val:
+                    errors.append(f"{field} must be between {min_val} and {max_val}")
+        # Validate boolean fields
+        bool_fields = ["StickinessEnabled"]
+        for field in bool_fields:
+            if field in props:
+                val = str(props[field]).lower()
+                if val not in _TRUE_FALSE:
+                    errors.append(f"{field} must be 'true' or 'false'")
+        return errors
+
+    def _validate_azure_nat_gateway(self, props: Dict[str, Any]) -> List[str]:
+        """Validate Azure NATGateway fields."""
+        errors: List[str] = []
+        # Validate IdleTimeoutMinutes if provided
+        if "IdleTimeoutMinutes" in props:
+            timeout = props["IdleTimeoutMinutes"]
+            if isinstance(timeout, (int, float)):
+                if timeout < 4 or timeout > 120:
+                    errors.append("IdleTimeoutMinutes must be between 4 and 120")
+        return errors
 
+    def _validate_azure_load_balancer(self, props: Dict[str, Any]) -> List[str]:
+        """Validate Azure LoadBalancer fields."""
+        errors: List[str] = []
+        # Validate BackendPoolResources if provided
+        if "BackendPoolResources" in props:
+            backend_resources = props["BackendPoolResources"]
+            if not isinstance(backend_resources, list):
+                errors.append("BackendPoolResources must be a comma-separated list")
+            elif not all(
+                resource_name
+                and isinstance(resource_name, str)
+                and not resource_name.isspace()
+                for resource_name in backend_resources
+            ):
+                errors.append(
+                    "BackendPoolResources entries must be non-empty resource names"
+                )
         return errors
 
+    _AWS_VALIDATORS: Dict[
+        str, Callable[["ExcelParserService", Dict[str, Any]], List[str]]
+    ] = {
+        "VPC": _validate_aws_vpc,
+        "NATGateway": _validate_aws_nat_gateway,
+        "ElasticIP": _validate_aws_elastic_ip,
+        "LoadBalancer": _validate_aws_load_balancer,
+        "TargetGroup": _validate_aws_target_group,
+    }
+
+    _AZURE_VALIDATORS: Dict[
+        str, Callable[["ExcelParserService", Dict[str, Any]], List[str]]
+    ] = {
+        "NATGateway": _validate_azure_nat_gateway,
+        "LoadBalancer": _validate_azure_load_balancer,
+    }
+
     def _is_valid_cidr(self, cidr: str) -> bool:
         """
         Validate CIDR notation.
@@ -1038,8 +1205,7 @@ class ExcelParserService:
         Returns:
             True if valid CIDR
         """
-        pattern = r"^([0-9]{1,3}\.){3}[0-9]{1,3}/([0-9]|[1-2][0-9]|3[0-2])$"
-        return bool(re.match(pattern, str(cidr)))
+        return _is_ipv4_cidr(str(cidr))
 
     def _merge_metadata_to_tags(self, properties: Dict[str, Any]) -> None:
         """
@@ -1057,15 +1223,60 @@ class ExcelParserService:
             # If Tags is not a dict (e.g., parsing failed), create empty dict
             tags = {}
 
-        # Metadata fields to merge into tags
-        metadata_fields = ["Environment", "Project", "Owner", "CostCenter"]
-
-        for field in metadata_fields:
-            if field in properties and properties[field]:
-                # Only add to tags if not already present (case-insensitive check)
-                tag_keys_lower = {k.lower(): k for k in tags.keys()}
-                if field.lower() not in tag_keys_lower:
-                    tags[field] = properties[field]
-
         # Update Tags in properties
         properties["Tags"] = tags
+
+        # Rows without metadata values have nothing to merge
+        get = properties.get
+        if not any(get(field) for field in self.METADATA_TAG_FIELDS):
+            return
+
+        # Only add to tags if not already present (case-insensitive check)
+        tag_keys_lower = {k.lower() for k in tags}
+
+        for field in self.METADATA_TAG_FIELDS:
+            value = get(field)
+            if value and field.lower() not in tag_keys_lower:
+                tags[field] = value
+                tag_keys_lower.add(field.lower())
+
+
+# Workbook bytes of the current sheet worker, set once per process
+_worker_file_content = b""
+
+
+def _init_sheet_worker(file_content: bytes) -> None:
+    """Hand the workbook to a sheet worker process."""
+    global _worker_file_content
+    _worker_file_content = file_content
+
+
+def _parse_sheet_in_worker(
+    sheet_name: str, cloud_platform: CloudPlatform
+) -> Tuple[List[ResourceInfo], List[str], List[str]]:
+    """Parse one resource sheet of the worker's workbook."""
+    return _parse_workbook_sheet(_worker_file_content, sheet_name, cloud_platform)
+
+
+def _parse_workbook_sheet(
+    file_content: bytes, sheet_name: str, cloud_platform: CloudPlatform
+) -> Tuple[List[ResourceInfo], List[str], List[str]]:
+    """
+    Parse one resource sheet of a workbook with a fresh parser.
+
+    Args:
+        file_content: Excel file content as bytes
+        sheet_name: Name of the sheet
+        cloud_platform: Cloud platform (AWS or Azure)
+
+    Returns:
+        Tuple of (resources, errors, warnings) produced by the sheet
+    """
+    parser = ExcelParserService()
+    resources: List[ResourceInfo] = []
+    with contextlib.closing(parser._iter_workbook_sheets(file_content)) as sheets:
+        for name, rows in sheets:
+            if name == sheet_name:
+                resources = parser._parse_resource_sheet(rows, name, cloud_platform)
+                break
+    return resources, parser.errors, parser.warnings
@@ -1,13 +1,22 @@
 """File utility services for ZIP creation and management."""
 
+import contextlib
 import io
 import os
+import tempfile
+import time
 import zipfile
-from typing import Dict
-from datetime import datetime
+from typing import BinaryIO, Dict, Iterator, Union
 import hashlib
 
 
+def _current_umask() -> int:
+    """Return the process umask, which can only be read by setting it."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
 class FileUtilsService:
     """Service for file operations including ZIP creation."""
 
@@ -35,28 +44,111 @@ class FileUtilsService:
         Returns:
             Tuple of (zip_bytes, zip_filename)
         """
+        zip_name = self._zip_filename(zip_name)
+
+        # Create ZIP file in memory
+        zip_buffer = io.BytesIO()
+        self._write_zip(zip_buffer, files)
+
+        return zip_buffer.getvalue(), zip_name
+
+    def write_zip_to_disk(
+        self, files: Dict[str, str], zip_name: str = None
+    ) -> tuple[str, str]:
+        """
+        Create a ZIP file from a dictionary of filenames and contents on disk.
+
+        The archive is written straight to the output directory, so it is
+        never held in memory as a whole.
+
+        Args:
+            files: Dictionary mapping filename to file content
+            zip_name: Optional custom ZIP filename (without extension)
+
+        Returns:
+            Tuple of (file_path, zip_filename)
+        """
+        zip_name = self._zip_filename(zip_name)
+        file_path = os.path.join(self.output_dir, zip_name)
+
+        with self._write_atomically(file_path) as f:
+            self._write_zip(f, files)
+
+        return file_path, zip_name
+
+    def write_zip_from_paths(
+        self, file_paths: Dict[str, str], zip_name: str = None
+    ) -> tuple[str, str]:
+        """
+        Create a ZIP file on disk from files that already exist on disk.
+
+        Source files are copied into the archive in chunks, so neither they
+        nor the archive are read into memory as a whole.
+
+        Args:
+            file_paths: Dictionary mapping filename in the ZIP to source path
+            zip_name: Optional custom ZIP filename (without extension)
+
+        Returns:
+            Tuple of (file_path, zip_filename)
+        """
+        zip_name = self._zip_filename(zip_name)
+        file_path = os.path.join(self.output_dir, zip_name)
+
+        with self._write_atomically(file_path) as f, self._open_zip(f) as zip_file:
+            for filename, source_path in file_paths.items():
+                # ZipFile.write streams the file and sizes ZIP64 from stat
+                zip_file.write(source_path, arcname=filename)
+
+        return file_path, zip_name
+
+    @staticmethod
+    def _zip_filename(zip_name: str = None) -> str:
+        """Return the ZIP filename, generating a timestamped one if needed."""
         # Generate ZIP filename if not provided
         if not zip_name:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            zip_name = f"terraform_code_{timestamp}"
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
+            return f"terraform_code_{timestamp}.zip"
 
         if not zip_name.endswith(".zip"):
             zip_name = f"{zip_name}.zip"
 
-        # Create ZIP file in memory
-        zip_buffer = io.BytesIO()
-
-        with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        return zip_name
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _write_atomically(file_path: str) -> Iterator[BinaryIO]:
+        """Open a temporary file that replaces file_path once fully written."""
+        # A failure part-way leaves no truncated file that could be served
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(file_path) or ".", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                yield f
+            # mkstemp creates the file as 0600; give it the usual umask mode
+            os.chmod(tmp_path, 0o666 & ~_current_umask())
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            raise
+
+    @staticmethod
+    def _open_zip(target: BinaryIO) -> zipfile.ZipFile:
+        """Open a ZIP archive for writing into a binary file object."""
+        # Level 1 keeps most of the size reduction on Terraform text at a
+        # fraction of the default level's CPU cost
+        return zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED, compresslevel=1)
+
+    @classmethod
+    def _write_zip(cls, target: BinaryIO, files: Dict[str, str]) -> None:
+        """Write the files as a ZIP archive into a binary file object."""
+        with cls._open_zip(target) as zip_file:
             for filename, content in files.items():
                 # Add file to ZIP
                 zip_file.writestr(filename, content)
 
-        # Get the ZIP bytes
-        zip_buffer.seek(0)
-        zip_bytes = zip_buffer.read()
-
-        return zip_bytes, zip_name
-
     def save_zip_to_disk(self, zip_bytes: bytes, zip_name: str) -> str:
         """
         Save ZIP bytes to disk.
@@ -75,17 +167,40 @@ class FileUtilsService:
 
         return file_path
 
-    def generate_file_hash(self, content: bytes) -> str:
+    def generate_file_hash(self, content: Union[bytes, BinaryIO, str]) -> str:
         """
         Generate SHA256 hash of file content.
 
+        Files are hashed in chunks, so a saved ZIP does not have to be read
+        into memory first.
+
         Args:
-            content: File content as bytes
+            content: File content as bytes, a path to the file, or a binary
+                file object positioned at the start of the content
 
         Returns:
             Hexadecimal hash string
         """
-        return hashlib.sha256(content).hexdigest()
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            return hashlib.sha256(content).hexdigest()
+
+        if isinstance(content, (str, os.PathLike)):
+            with open(content, "rb") as f:
+                return self._hash_file(f)
+
+        return self._hash_file(content)
+
+    @staticmethod
+    def _hash_file(f: BinaryIO) -> str:
+        """Return the SHA256 hex digest of a binary file object."""
+        # hashlib.file_digest is only available from Python 3.11
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
 
     def cleanup_old_files(self, max_age_hours: int = 24):
         """
@@ -97,24 +212,23 @@ class FileUtilsService:
         if not os.path.exists(self.output_dir):
             return
 
-        current_time = datetime.now().timestamp()
+        current_time = time.time()
         max_age_seconds = max_age_hours * 3600
 
-        for filename in os.listdir(self.output_dir):
-            file_path = os.path.join(self.output_dir, filename)
-
-            # Skip if not a file
-            if not os.path.isfile(file_path):
-                continue
-
-            # Check file age
-            file_mtime = os.path.getmtime(file_path)
-            age_seconds = current_time - file_mtime
-
-            # Delete if too old
-            if age_seconds > max_age_seconds:
-                try:
-                    os.remove(file_path)
-                except Exception:
-                    # Ignore errors during cleanup
-                    pass
+        # DirEntry caches the file type, so only the age check needs a stat
+        with os.scandir(self.output_dir) as entries:
+            for entry in entries:
+                # Skip if not a file
+                if not entry.is_file():
+                    continue
+
+                # Check file age
+                age_seconds = current_time - entry.stat().st_mtime
+
+                # Delete if too old
+                if age_seconds > max_age_seconds:
+                    try:
+                        os.remove(entry.path)
+                    except Exception:
+                        # Ignore errors during cleanup
+                        pass
@@ -3,27 +3,112 @@
 This service handles terraform init, plan, and apply operations.
 """
 
+import functools
 import os
 import re
 import json
 import shutil
 import subprocess
 import tempfile
+import textwrap
+import threading
 import uuid
 import logging
+from collections import deque
 from datetime import datetime
-from typing import Dict, Optional, Tuple
+from typing import IO, Deque, Dict, Optional, Tuple
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
+from app.core.config import get_settings
 from app.models import DeploymentEnvironment, Deployment, DeploymentStatus
 
 logger = logging.getLogger(__name__)
 
+_PLAN_SUMMARY_RE = re.compile(r"Plan: (\d+) to add, (\d+) to change, (\d+) to destroy")
+
+# Terraform's plugin cache is not safe for concurrent init, so inits from
+# this process's executors take turns writing to it
+_PLUGIN_CACHE_LOCK = threading.Lock()
+
+
+# Root module output blocks, in HCL with a quoted or bare label
+_OUTPUT_BLOCK_RE = re.compile(r'^\s*output\s+["\w]', re.MULTILINE)
+
+
+def _declares_outputs(terraform_code: Optional[Dict[str, str]]) -> bool:
+    """Return whether the configuration may declare any outputs.
+
+    JSON configuration files are not inspected and always count as
+    declaring outputs.
+    """
+    for filename, content in (terraform_code or {}).items():
+        if filename.endswith(".tf.json") or _OUTPUT_BLOCK_RE.search(content):
+            return True
+    return False
+
+
+def _indent_log_lines(text: str) -> str:
+    """Prefix every line of text so it can be logged as one record."""
+    return textwrap.indent(text, "[TF]   ", lambda line: True)
+
+
+@functools.lru_cache(maxsize=1)
+def _locate_terraform_binary() -> str:
+    """Find the terraform binary path.
+
+    The result is cached for the life of the process; a failed lookup is not
+    cached, so installing Terraform later is picked up on the next call.
+
+    Returns:
+        Path to terraform binary
+
+    Raises:
+        RuntimeError: If terraform is not installed
+    """
+    # Try common locations
+    if os.name == "nt":  # Windows
+        terraform_paths = [
+            shutil.which("terraform"),
+            r"C:\terraform\terraform.exe",
+            os.path.expanduser(r"~\terraform\terraform.exe"),
+        ]
+
+        # Add Winget path search
+        local_app_data = os.environ.get("LOCALAPPDATA", "")
+        if local_app_data:
+            winget_packages = os.path.join(
+                local_app_data, "Microsoft", "WinGet", "Packages"
+            )
+            if os.path.exists(winget_packages):
+                for item in os.listdir(winget_packages):
+                    if "Hashicorp.Terraform" in item:
+                        tf_path = os.path.join(winget_packages, item, "terraform.exe")
+                        if os.path.exists(tf_path):
+                            terraform_paths.append(tf_path)
+    else:  # Unix/Linux/Mac
+        terraform_paths = [
+            shutil.which("terraform"),
+            "/usr/local/bin/terraform",
+            "/usr/bin/terraform",
+            os.path.expanduser("~/.local/bin/terraform"),
+        ]
+
+    for path in terraform_paths:
+        if path and os.path.isfile(path):
+            return path
+
+    raise RuntimeError(
+        "Terraform CLI not found. Please install Terraform and ensure it's in PATH."
+    )
+
 
 class TerraformExecutor:
     """Service for executing Terraform commands."""
 
+    # Lines of stdout/stderr kept per command; older lines are only logged
+    OUTPUT_TAIL_LINES = 5000
+
     def __init__(self, db: Session):
         """Initialize the executor.
 
@@ -32,6 +117,12 @@ class TerraformExecutor:
         """
         self.db = db
         self.terraform_bin = self._find_terraform_binary()
+        self.parallelism = get_settings().TERRAFORM_PARALLELISM
+        # Providers downloaded by one deployment's init are reused by the next
+        self.plugin_cache_dir = os.environ.get("TF_PLUGIN_CACHE_DIR") or os.path.join(
+            tempfile.gettempdir(), "iac4_plugin_cache"
+        )
+        os.makedirs(self.plugin_cache_dir, exist_ok=True)
 
     def _find_terraform_binary(self) -> str:
         """Find the terraform binary path.
@@ -42,43 +133,7 @@ class TerraformExecutor:
         Raises:
             RuntimeError: If terraform is not installed
         """
-        # Try common locations
-        if os.name == "nt":  # Windows
-            terraform_paths = [
-                shutil.which("terraform"),
-                r"C:\terraform\terraform.exe",
-                os.path.expanduser(r"~\terraform\terraform.exe"),
-            ]
-
-            # Add Winget path search
-            local_app_data = os.environ.get("LOCALAPPDATA", "")
-            if local_app_data:
-                winget_packages = os.path.join(
-                    local_app_data, "Microsoft", "WinGet", "Packages"
-                )
-                if os.path.exists(winget_packages):
-                    for item in os.listdir(winget_packages):
-                        if "Hashicorp.Terraform" in item:
-                            tf_path = os.path.join(
-                                winget_packages, item, "terraform.exe"
-                            )
-                            if os.path.exists(tf_path):
-                                terraform_paths.append(tf_path)
-        else:  # Unix/Linux/Mac
-            terraform_paths = [
-                shutil.which("terraform"),
-                "/usr/local/bin/terraform",
-                "/usr/bin/terraform",
-                os.path.expanduser("~/.local/bin/terraform"),
-            ]
-
-        for path in terraform_paths:
-            if path and os.path.isfile(path):
-                return path
-
-        raise RuntimeError(
-            "Terraform CLI not found. Please install Terraform and ensure it's in PATH."
-        )
+        return _locate_terraform_binary()
 
     def _prepare_work_dir(
         self, terraform_code: Dict[str, str], deployment_id: str
@@ -121,6 +176,12 @@ class TerraformExecutor:
             Dictionary of environment variables
         """
         env = os.environ.copy()
+        env["TF_PLUGIN_CACHE_DIR"] = self.plugin_cache_dir
+        # Work dirs start without a lock file, which Terraform 1.4+ otherwise
+        # treats as a reason to bypass the plugin cache. The lock file that
+        # init writes then only records checksums for this platform.
+        env.setdefault("TF_PLUGIN_CACHE_MAY_BREAK_DEPENDENCY_LOCK_FILE", "1")
+        env.setdefault("TF_IN_AUTOMATION", "1")
 
         from app.api.llm_config import decrypt_api_key
 
@@ -165,14 +226,24 @@ class TerraformExecutor:
         work_dir: str,
         env: Dict[str, str],
         timeout: int = 600,
+        log_output: bool = True,
+        keep_all_output: bool = False,
     ) -> Tuple[int, str, str]:
         """Run a command and return output.
 
+        Output is logged as the command produces it. Only the last
+        OUTPUT_TAIL_LINES lines of each stream are kept unless
+        keep_all_output is set.
+
         Args:
             args: Command arguments
             work_dir: Working directory
             env: Environment variables
             timeout: Command timeout in seconds
+            log_output: Log each output line; disable for output that may
+                contain sensitive values
+            keep_all_output: Keep the whole output instead of the tail, for
+                structured output that is parsed afterwards
 
         Returns:
             Tuple of (return_code, stdout, stderr)
@@ -180,23 +251,99 @@ class TerraformExecutor:
         try:
             # Use encoding='utf-8' explicitly for Windows compatibility
             # Terraform outputs UTF-8, but Windows default is often GBK/CP936
-            result = subprocess.run(
+            process = subprocess.Popen(
                 args,
                 cwd=work_dir,
                 env=env,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True,
                 encoding="utf-8",
                 errors="replace",  # Replace undecodable bytes instead of failing
-                timeout=timeout,
+                bufsize=1,
             )
-            return result.returncode, result.stdout or "", result.stderr or ""
+        except Exception as e:
+            return -1, "", str(e)
+
+        maxlen = None if keep_all_output else self.OUTPUT_TAIL_LINES
+        stdout_tail: Deque[str] = deque(maxlen=maxlen)
+        stderr_tail: Deque[str] = deque(maxlen=maxlen)
+        # A provider child process may hold the pipes open after terraform
+        # exits, so the readers can still be appending when we collect output
+        lock = threading.Lock()
+        readers = [
+            threading.Thread(
+                target=self._drain_stream,
+                args=(process.stdout, stdout_tail, lock, log_output),
+            ),
+            threading.Thread(
+                target=self._drain_stream,
+                args=(process.stderr, stderr_tail, lock, log_output),
+            ),
+        ]
+        for reader in readers:
+            reader.daemon = True
+            reader.start()
+
+        try:
+            returncode = process.wait(timeout=timeout)
         except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
             # Clean up lock files on timeout to prevent deadlocks
             self._cleanup_lock_files(work_dir)
+            returncode = None
+        finally:
+            for reader in readers:
+                reader.join(timeout=5)
+
+        if returncode is None:
             return -1, "", f"Command timed out after {timeout} seconds"
-        except Exception as e:
-            return -1, "", str(e)
+        with lock:
+            return returncode, "".join(stdout_tail), "".join(stderr_tail)
+
+    def _run_init(
+        self,
+        args: list,
+        work_dir: str,
+        env: Dict[str, str],
+        timeout: int = 600,
+    ) -> Tuple[int, str, str]:
+        """Run terraform init while holding the plugin cache lock.
+
+        Args:
+            args: Command arguments
+            work_dir: Working directory
+            env: Environment variables
+            timeout: Command timeout in seconds
+
+        Returns:
+            Tuple of (return_code, stdout, stderr)
+        """
+        with _PLUGIN_CACHE_LOCK:
+            return self._run_command(args, work_dir, env, timeout=timeout)
+
+    @staticmethod
+    def _drain_stream(
+        stream: IO[str],
+        tail: Deque[str],
+        lock: threading.Lock,
+        log_output: bool = True,
+    ) -> None:
+        """Log each line of a command's output and keep the latest lines.
+
+        Args:
+            stream: stdout or stderr pipe of the running command
+            tail: Buffer receiving the lines
+            lock: Lock held while appending to the buffer
+            log_output: Whether to log each line
+        """
+        with stream:
+            for line in stream:
+                with lock:
+                    tail.append(line)
+                if log_output:
+                    logger.info(f"[TF]   {line.rstrip()}")
 
     def _parse_plan_output(self, plan_output: str) -> Dict[str, int]:
         """Parse terraform plan output to extract resource counts.
@@ -211,10 +358,7 @@ class TerraformExecutor:
 
         # Look for the plan summary line like:
         # "Plan: 2 to add, 1 to change, 0 to destroy."
-        match = re.search(
-            r"Plan: (\d+) to add, (\d+) to change, (\d+) to destroy",
-            plan_output,
-        )
+        match = _PLAN_SUMMARY_RE.search(plan_output)
         if match:
             summary["add"] = int(match.group(1))
             summary["change"] = int(match.group(2))
@@ -308,10 +452,11 @@ class TerraformExecutor:
             # Log main.tf content for debugging
             if deployment.terraform_code and "main.tf" in deployment.terraform_code:
                 main_tf = deployment.terraform_code["main.tf"]
-                logger.info(f"[TF] main.tf content ({len(main_tf)} chars):")
-                # Log first 1000 chars
-                for line in main_tf[:1500].split("\n"):
-                    logger.info(f"[TF]   {line}")
+                # Log first 1500 chars
+                logger.info(
+                    f"[TF] main.tf content ({len(main_tf)} chars):\n"
+                    f"{_indent_log_lines(main_tf[:1500])}"
+                )
                 if len(main_tf) > 1500:
                     logger.info(
                         f"[TF]   ... (truncated, {len(main_tf) - 1500} more chars)"
@@ -325,7 +470,7 @@ class TerraformExecutor:
 
             # Run terraform init
             logger.info("[TF] Running terraform init...")
-            returncode, stdout, stderr = self._run_command(
+            returncode, stdout, stderr = self._run_init(
                 [self.terraform_bin, "init", "-no-color", "-input=false"],
                 work_dir,
                 env,
@@ -350,6 +495,7 @@ class TerraformExecutor:
                     "plan",
                     "-no-color",
                     "-input=false",
+                    f"-parallelism={self.parallelism}",
                     "-out=tfplan",
                 ],
                 work_dir,
@@ -362,16 +508,18 @@ class TerraformExecutor:
 
             if returncode != 0:
                 logger.error("[TF] terraform plan FAILED!")
-                logger.error("[TF] Plan output (first 2000 chars):")
-                for line in plan_output[:2000].split("\n"):
-                    logger.error(f"[TF]   {line}")
+                logger.error(
+                    "[TF] Plan output (first 2000 chars):\n"
+                    f"{_indent_log_lines(plan_output[:2000])}"
+                )
                 if len(plan_output) > 2000:
                     logger.error(
                         f"[TF] ... (truncated {len(plan_output) - 4000} chars) ..."
                     )
-                    logger.error("[TF] Plan output (last 2000 chars):")
-                    for line in plan_output[-2000:].split("\n"):
-                        logger.error(f"[TF]   {line}")
+                    logger.error(
+                        "[TF] Plan output (last 2000 chars):\n"
+                        f"{_indent_log_lines(plan_output[-2000:])}"
+                    )
                 deployment.status = DeploymentStatus.PLAN_FAILED
                 deployment.plan_output = plan_output
                 deployment.error_message = "terraform plan failed"
@@ -411,8 +559,10 @@ class TerraformExecutor:
         # 1. Function start - print deployment_id and status
         logger.info(f"[TF] run_apply called for deployment_id={deployment_id}")
 
+        # Load the target environment in the same query
         deployment = (
             self.db.query(Deployment)
+            .options(joinedload(Deployment.environment))
             .filter(Deployment.deployment_id == deployment_id)
             .first()
         )
@@ -436,11 +586,7 @@ class TerraformExecutor:
             )
         logger.info("[TF] Status check passed - deployment is ready for apply")
 
-        environment = (
-            self.db.query(DeploymentEnvironment)
-            .filter(DeploymentEnvironment.id == deployment.environment_id)
-            .first()
-        )
+        environment = deployment.environment
         # 4. After environment lookup - print environment details
         if not environment:
             logger.error(f"[TF] Environment {deployment.environment_id} NOT FOUND")
@@ -473,6 +619,7 @@ class TerraformExecutor:
                 "-no-color",
                 "-input=false",
                 "-auto-approve",
+                f"-parallelism={self.parallelism}",
                 "tfplan",
             ]
             logger.info("[TF] Preparing terraform apply")
@@ -500,9 +647,10 @@ class TerraformExecutor:
             if returncode != 0:
                 # 8. If apply fails - print error details
                 logger.error("[TF] terraform apply FAILED!")
-                logger.error("[TF] Apply output (first 2000 chars):")
-                for line in apply_output[:2000].split("\n"):
-                    logger.error(f"[TF]   {line}")
+                logger.error(
+                    "[TF] Apply output (first 2000 chars):\n"
+                    f"{_indent_log_lines(apply_output[:2000])}"
+                )
                 if len(apply_output) > 2000:
                     logger.error(
                         f"[TF] ... (truncated, {len(apply_output) - 2000} more chars)"
@@ -516,35 +664,44 @@ class TerraformExecutor:
 
             logger.info("[TF] terraform apply SUCCESS")
 
-            # 9. Before getting outputs - print command
-            output_cmd = [self.terraform_bin, "output", "-json"]
-            logger.info("[TF] Getting terraform outputs")
-            logger.info(f"[TF] Command: {' '.join(output_cmd)}")
-            # Get terraform outputs
-            returncode, stdout, stderr = self._run_command(
-                output_cmd,
-                work_dir,
-                env,
-            )
-
             terraform_outputs = {}
-            # 10. After getting outputs - print success/failure
-            logger.info(
-                f"[TF] terraform output command completed - returncode: {returncode}"
-            )
-            if returncode == 0 and stdout.strip():
-                try:
-                    terraform_outputs = json.loads(stdout)
-                    logger.info(
-                        f"[TF] Successfully parsed terraform outputs - {len(terraform_outputs)} output(s) found"
-                    )
-                except json.JSONDecodeError as e:
+            if _declares_outputs(deployment.terraform_code):
+                # 9. Before getting outputs - print command
+                output_cmd = [self.terraform_bin, "output", "-json"]
+                logger.info("[TF] Getting terraform outputs")
+                logger.info(f"[TF] Command: {' '.join(output_cmd)}")
+                # Get terraform outputs
+                # Sensitive outputs are printed in cleartext, so keep them
+                # out of the logs
+                returncode, stdout, stderr = self._run_command(
+                    output_cmd,
+                    work_dir,
+                    env,
+                    log_output=False,
+                    keep_all_output=True,
+                )
+
+                # 10. After getting outputs - print success/failure
+                logger.info(
+                    f"[TF] terraform output command completed - returncode: {returncode}"
+                )
+                if returncode == 0 and stdout.strip():
+                    try:
+                        terraform_outputs = json.loads(stdout)
+                        logger.info(
+                            f"[TF] Successfully parsed terraform outputs - {len(terraform_outputs)} output(s) found"
+                        )
+                    except json.JSONDecodeError as e:
+                        logger.warning(
+                            f"[TF] Failed to parse terraform outputs as JSON: {e}"
+                        )
+                else:
                     logger.warning(
-                        f"[TF] Failed to parse terraform outputs as JSON: {e}"
+                        f"[TF] terraform output command failed or returned empty - returncode: {returncode}"
                     )
             else:
-                logger.warning(
-                    f"[TF] terraform output command failed or returned empty - returncode: {returncode}"
+                logger.info(
+                    "[TF] Configuration declares no outputs, skipping terraform output"
                 )
 
             deployment.status = DeploymentStatus.APPLY_SUCCESS
@@ -621,7 +778,16 @@ class TerraformExecutor:
 
         try:
             if os.path.exists(deployment.work_dir):
-                shutil.rmtree(deployment.work_dir)
+                # Move the directory aside and delete it in the background, so
+                # callers do not wait on the provider files under .terraform
+                trash_dir = f"{deployment.work_dir}.trash.{uuid.uuid4().hex[:8]}"
+                os.rename(deployment.work_dir, trash_dir)
+                threading.Thread(
+                    target=shutil.rmtree,
+                    args=(trash_dir,),
+                    kwargs={"ignore_errors": True},
+                    daemon=True,
+                ).start()
             return True
         except Exception:
             return False
@@ -653,6 +819,8 @@ class TerraformExecutor:
         if not environment:
             raise ValueError(f"Environment {deployment.environment_id} not found")
 
+        env = self._get_env_variables(environment)
+
         work_dir = deployment.work_dir
         if not work_dir or not os.path.exists(work_dir):
             # Recreate the working directory from stored code
@@ -662,10 +830,7 @@ class TerraformExecutor:
             deployment.work_dir = work_dir
 
             # Need to reinitialize
-            env = self._get_env_variables(environment)
-            self._run_command([self.terraform_bin, "init", "-no-color"], work_dir, env)
-
-        env = self._get_env_variables(environment)
+            self._run_init([self.terraform_bin, "init", "-no-color"], work_dir, env)
 
         returncode, stdout, stderr = self._run_command(
             [
@@ -674,6 +839,7 @@ class TerraformExecutor:
                 "-no-color",
                 "-input=false",
                 "-auto-approve",
+                f"-parallelism={self.parallelism}",
             ],
             work_dir,
             env,
@@ -2,7 +2,7 @@
 
 import os
 from typing import Dict, List, Any
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
 from app.schemas import CloudPlatform
 
 
@@ -20,7 +20,10 @@ class TerraformCodeGenerator:
             autoescape=select_autoescape(),
             trim_blocks=True,
             lstrip_blocks=True,
+            auto_reload=False,
         )
+        # Compiled templates by name, so repeated resources skip the loader
+        self._template_cache: Dict[str, Template] = {}
 
         # Add custom filters
         self.env.filters["tojson"] = self._to_json
@@ -515,7 +518,10 @@ provider "azurerm" {
         )
 
         try:
-            template = self.env.get_template(template_name)
+            template = self._template_cache.get(template_name)
+            if template is None:
+                template = self.env.get_template(template_name)
+                self._template_cache[template_name] = template
             print(
                 "[TerraformGenerator._generate_resource_code]   Template loaded successfully"
             )
@@ -162,5 +162,32 @@ def test_azure_subnet_validation_with_invalid_exists_fields():
     assert "VNetExists must be 'y' or 'n'" in exists_errors
 
 
+def test_azure_validation_fail_fast_reports_only_first_error():
+    """Test that fail_fast stops at the first failing check."""
+    parser = ExcelParserService()
+
+    resource = ResourceInfo(
+        resource_type="Subnet",
+        cloud_platform=CloudPlatform.AZURE,
+        resource_name="test-subnet",
+        properties={
+            "ResourceName": "test-subnet",
+            "ResourceGroup": "test-rg",
+            "ResourceGroupExists": "invalid",
+            "VNet": "test-vnet",
+            "VNetExists": "sometimes",
+            "AddressPrefix": "10.0.1.0/24",
+            "Environment": "test",
+            "Project": "test-project",
+        },
+    )
+
+    _, all_errors = parser.validate_resource(resource)
+    is_valid, errors = parser.validate_resource(resource, fail_fast=True)
+
+    assert not is_valid
+    assert errors == all_errors[:1]
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
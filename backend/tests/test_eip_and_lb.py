@@ -137,6 +137,30 @@ class TestAWSElasticIP:
 
         assert 'resource "aws_eip"' in main_tf
 
+    def test_elastic_ip_template_loaded_once(self):
+        """Test that repeated resources reuse the compiled template."""
+        resources = [
+            {
+                "resource_type": "ElasticIP",
+                "cloud_platform": "aws",
+                "resource_name": f"eip-{index}",
+                "properties": {"Region": "us-east-1", "Domain": "vpc"},
+            }
+            for index in range(3)
+        ]
+        loads = []
+        get_template = self.generator.env.get_template
+
+        def counting_get_template(name):
+            loads.append(name)
+            return get_template(name)
+
+        self.generator.env.get_template = counting_get_template
+        main_tf = self.generator.generate_code(resources)["main.tf"]
+
+        assert main_tf.count('resource "aws_eip"') == 3
+        assert loads.count("aws/elastic_ip.tf.j2") == 1
+
 
 class TestAzureLoadBalancer:
     """Tests for Azure Load Balancer resource generation."""
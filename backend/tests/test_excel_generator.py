@@ -0,0 +1,52 @@
+"""Tests for Excel template generation."""
+
+import io
+
+from openpyxl import load_workbook
+
+from app.schemas import TemplateType
+from app.services.excel_generator import ExcelGeneratorService
+
+
+def _load_template(template_type):
+    content = ExcelGeneratorService().generate_template(template_type)
+    return load_workbook(io.BytesIO(content))
+
+
+def test_full_template_keeps_header_and_sample_rows():
+    wb = _load_template(TemplateType.FULL)
+
+    assert wb.sheetnames[0] == "README"
+    ws = wb["AWS_TargetGroup"]
+    headers = [c.value for c in ws[1]]
+    samples = [c.value for c in ws[2]]
+
+    assert headers[0] == "ResourceName*"
+    targets_idx = headers.index("Targets")
+    # Sample JSON must stay a literal string, never a formula or hyperlink
+    assert samples[targets_idx] == '[{"Id": "i-1234567890abcdef0", "Port": 80}]'
+    assert ws.cell(row=2, column=targets_idx + 1).data_type == "s"
+
+
+def test_dropdowns_cover_the_whole_column():
+    wb = _load_template(TemplateType.AWS)
+    ws = wb["AWS_Subnet"]
+
+    sqrefs = [str(dv.sqref) for dv in ws.data_validations.dataValidation]
+    assert sqrefs
+    for sqref in sqrefs:
+        for cell_range in sqref.split():
+            assert cell_range.endswith("1048576")
+
+
+def test_columns_sharing_options_use_one_validation():
+    wb = _load_template(TemplateType.AWS)
+    ws = wb["AWS_RDS"]
+
+    boolean_validations = [
+        dv
+        for dv in ws.data_validations.dataValidation
+        if dv.formula1 == '"true,false"'
+    ]
+    assert len(boolean_validations) == 1
+    assert len(str(boolean_validations[0].sqref).split()) == 4
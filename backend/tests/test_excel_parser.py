@@ -0,0 +1,230 @@
+"""Tests for Excel resource sheet parsing."""
+
+import io
+import math
+
+from openpyxl import Workbook
+from openpyxl.chart import BarChart, Reference
+
+from app.schemas import CloudPlatform, ResourceInfo
+from app.services.excel_parser import ExcelParserService
+
+
+def _build_excel_bytes(sheets):
+    wb = Workbook()
+    wb.remove(wb.active)
+    for title, rows in sheets.items():
+        ws = wb.create_sheet(title)
+        for row in rows:
+            ws.append(row)
+
+    buf = io.BytesIO()
+    wb.save(buf)
+    return buf.getvalue()
+
+
+def test_required_markers_are_stripped_from_headers():
+    content = _build_excel_bytes(
+        {
+            "AWS_VPC": [
+                ["ResourceName*", "Environment*", "Project*", "Region*", "CIDR_Block*"],
+                ["vpc-main", "Production", "Demo", "us-east-1", "10.0.0.0/16"],
+            ]
+        }
+    )
+
+    result = ExcelParserService().parse_excel_file(content)
+
+    assert result.success is True
+    assert result.resource_types == ["AWS_VPC"]
+    resource = result.resources[0]
+    assert resource.resource_name == "vpc-main"
+    assert resource.properties["CIDR_Block"] == "10.0.0.0/16"
+
+
+def test_empty_resource_sheet_is_ignored():
+    content = _build_excel_bytes({"AWS_VPC": [], "README": [["Instructions"]]})
+
+    result = ExcelParserService().parse_excel_file(content)
+
+    assert result.success is True
+    assert result.resource_count == 0
+    assert result.errors is None
+
+
+def test_chartsheets_are_skipped():
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "AWS_VPC"
+    ws.append(["ResourceName", "Region", "CIDR_Block"])
+    ws.append(["vpc-main", "us-east-1", "10.0.0.0/16"])
+    chart = BarChart()
+    chart.add_data(Reference(ws, min_col=3, min_row=1, max_row=2))
+    wb.create_chartsheet("Chart").add_chart(chart)
+    buf = io.BytesIO()
+    wb.save(buf)
+
+    result = ExcelParserService().parse_excel_file(buf.getvalue())
+
+    assert result.success is True
+    assert result.resource_count == 1
+    assert result.errors is None
+
+
+def test_cells_without_a_header_are_ignored():
+    content = _build_excel_bytes(
+        {
+            "AWS_VPC": [
+                ["ResourceName", None, "Region", "CIDR_Block"],
+                ["vpc-main", "stray", "us-east-1", "10.0.0.0/16", "overflow"],
+                ["vpc-short", None, "us-west-2"],
+                [None, "stray-only"],
+            ]
+        }
+    )
+
+    result = ExcelParserService().parse_excel_file(content)
+
+    assert result.resource_count == 2
+    assert result.warnings is None
+    first, second = result.resources
+    assert first.properties == {
+        "ResourceName": "vpc-main",
+        "Region": "us-east-1",
+        "CIDR_Block": "10.0.0.0/16",
+        "Tags": {},
+    }
+    assert second.properties["Region"] == "us-west-2"
+    assert "CIDR_Block" not in second.properties
+
+
+def test_vpc_cidr_octets_must_be_in_range():
+    parser = ExcelParserService()
+
+    def cidr_errors(cidr):
+        resource = ResourceInfo(
+            resource_type="VPC",
+            cloud_platform=CloudPlatform.AWS,
+            resource_name="vpc-main",
+            properties={
+                "ResourceName": "vpc-main",
+                "Environment": "test",
+                "Project": "demo",
+                "Region": "us-east-1",
+                "CIDR_Block": cidr,
+            },
+        )
+        return parser.validate_resource(resource)[1]
+
+    assert cidr_errors("10.0.0.0/16") == []
+    assert cidr_errors("10.0.1.5/24") == []
+    assert cidr_errors("999.1.1.1/8") == ["Invalid CIDR format: 999.1.1.1/8"]
+    assert cidr_errors("10.0.0.0/33") == ["Invalid CIDR format: 10.0.0.0/33"]
+    assert cidr_errors("10.0.0.0") == ["Invalid CIDR format: 10.0.0.0"]
+
+
+def test_missing_required_fields_are_reported_together():
+    resource = ResourceInfo(
+        resource_type="VPC",
+        cloud_platform=CloudPlatform.AWS,
+        resource_name="vpc-main",
+        properties={"ResourceName": "vpc-main", "Project": "demo"},
+    )
+
+    is_valid, errors = ExcelParserService().validate_resource(resource)
+
+    assert is_valid is False
+    assert errors == [
+        "Missing required field: Environment",
+        "Missing required fields for VPC: Region, CIDR_Block",
+    ]
+
+
+def test_json_columns_keep_plain_text_with_a_warning():
+    parser = ExcelParserService()
+
+    assert parser._convert_json_value(' {"Team": "web"} ', "Tags") == {"Team": "web"}
+    assert parser._convert_json_value("42", "DataDisks") == 42
+    assert parser._convert_json_value("Infinity", "DataDisks") == float("inf")
+    assert parser._convert_json_value("-Infinity", "DataDisks") == float("-inf")
+    assert math.isnan(parser._convert_json_value("NaN", "DataDisks"))
+    assert parser.warnings == []
+
+    assert parser._convert_json_value("Team=web", "Tags") == "Team=web"
+    assert parser._convert_json_value("{Team: web}", "Tags") == "{Team: web}"
+    assert parser.warnings == [
+        "Invalid JSON in field Tags: Team=web...",
+        "Invalid JSON in field Tags: {Team: web}...",
+    ]
+
+
+def test_large_workbooks_parse_sheets_in_worker_processes(monkeypatch):
+    content = _build_excel_bytes(
+        {
+            "README": [["Instructions"]],
+            "AWS_VPC": [
+                ["ResourceName", "Region", "CIDR_Block", "Tags"],
+                ["vpc-main", "us-east-1", "10.0.0.0/16", "Team=web"],
+            ],
+            "Azure_Subnet": [
+                ["ResourceName", "VNet", "AddressPrefix", "ServiceEndpoints"],
+                [
+                    "snet-app",
+                    "vnet-main",
+                    "10.1.0.0/24",
+                    "Microsoft.Sql, Microsoft.Web",
+                ],
+            ],
+        }
+    )
+    sequential = ExcelParserService().parse_excel_file(content)
+
+    monkeypatch.setattr(ExcelParserService, "PARALLEL_PARSE_MIN_BYTES", 0)
+    monkeypatch.setattr("app.services.excel_parser.os.cpu_count", lambda: 2)
+    parallel = ExcelParserService().parse_excel_file(content)
+
+    assert parallel.resource_types == ["AWS_VPC", "Azure_Subnet"]
+    assert parallel.warnings == ["Invalid JSON in field Tags: Team=web..."]
+    assert parallel.model_dump() == sequential.model_dump()
+
+
+def test_iter_parse_streams_resources_in_workbook_order():
+    content = _build_excel_bytes(
+        {
+            "README": [["Instructions"]],
+            "AWS_VPC": [
+                ["ResourceName", "Region", "CIDR_Block"],
+                ["vpc-main", "us-east-1", "10.0.0.0/16"],
+                [None, "us-west-2", "10.1.0.0/16"],
+            ],
+            "Azure_VNet": [
+                ["ResourceName", "Location", "AddressSpace"],
+                ["vnet-main", "eastus", "10.2.0.0/16"],
+            ],
+        }
+    )
+    parser = ExcelParserService()
+
+    names = [
+        resource.resource_name for resource in parser.iter_parse_excel_file(content)
+    ]
+
+    assert names == ["vpc-main", "vnet-main"]
+    assert parser.warnings == [
+        "Sheet AWS_VPC, Row 3: Missing ResourceName, skipping row"
+    ]
+    expected = ExcelParserService().parse_excel_file(content)
+    assert [r.resource_name for r in expected.resources] == names
+
+
+def test_metadata_merges_into_tags_without_overriding_existing_keys():
+    properties = {
+        "Environment": "Production",
+        "Project": "",
+        "Owner": "platform-team",
+        "Tags": {"environment": "dev"},
+    }
+
+    ExcelParserService()._merge_metadata_to_tags(properties)
+
+    assert properties["Tags"] == {"environment": "dev", "Owner": "platform-team"}
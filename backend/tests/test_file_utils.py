@@ -0,0 +1,100 @@
+"""Tests for generated-code ZIP helpers."""
+
+import io
+import os
+import time
+import zipfile
+
+import pytest
+
+from app.services.file_utils import FileUtilsService
+
+
+def test_zip_written_to_disk_matches_in_memory_zip(tmp_path):
+    utils = FileUtilsService(output_dir=str(tmp_path))
+    files = {"main.tf": 'resource "aws_vpc" "main" {}\n', "README.md": "# Demo\n"}
+
+    zip_bytes, zip_name = utils.create_zip_from_files(files, "bundle")
+    file_path, disk_name = utils.write_zip_to_disk(files, "bundle")
+
+    assert zip_name == disk_name == "bundle.zip"
+    assert file_path == str(tmp_path / "bundle.zip")
+    with zipfile.ZipFile(file_path) as on_disk:
+        in_memory = zipfile.ZipFile(io.BytesIO(zip_bytes))
+        assert on_disk.namelist() == in_memory.namelist() == list(files)
+        for name, content in files.items():
+            assert on_disk.read(name).decode() == content
+            assert in_memory.read(name).decode() == content
+
+
+def test_file_hash_is_the_same_for_bytes_paths_and_file_objects(tmp_path):
+    utils = FileUtilsService(output_dir=str(tmp_path))
+    file_path, _ = utils.write_zip_to_disk({"main.tf": "# empty\n"})
+    zip_bytes = (tmp_path / os.path.basename(file_path)).read_bytes()
+
+    expected = utils.generate_file_hash(zip_bytes)
+
+    assert utils.generate_file_hash(file_path) == expected
+    with open(file_path, "rb") as f:
+        assert utils.generate_file_hash(f) == expected
+    assert utils.generate_file_hash(io.BytesIO(zip_bytes)) == expected
+
+
+def test_cleanup_removes_only_files_older_than_max_age(tmp_path):
+    utils = FileUtilsService(output_dir=str(tmp_path))
+    old_zip = tmp_path / "old.zip"
+    new_zip = tmp_path / "new.zip"
+    old_zip.write_bytes(b"")
+    new_zip.write_bytes(b"")
+    (tmp_path / "nested").mkdir()
+    two_days_ago = time.time() - 48 * 3600
+    os.utime(old_zip, (two_days_ago, two_days_ago))
+    os.utime(tmp_path / "nested", (two_days_ago, two_days_ago))
+
+    utils.cleanup_old_files(max_age_hours=24)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["nested", "new.zip"]
+
+
+def test_zip_from_paths_copies_source_files(tmp_path):
+    source = tmp_path / "src"
+    source.mkdir()
+    (source / "main.tf").write_text('resource "aws_vpc" "main" {}\n')
+    (source / "variables.tf").write_text('variable "region" {}\n')
+    utils = FileUtilsService(output_dir=str(tmp_path / "out"))
+
+    file_path, zip_name = utils.write_zip_from_paths(
+        {
+            "main.tf": str(source / "main.tf"),
+            "modules/variables.tf": str(source / "variables.tf"),
+        },
+        "bundle",
+    )
+
+    assert zip_name == "bundle.zip"
+    with zipfile.ZipFile(file_path) as zip_file:
+        assert zip_file.namelist() == ["main.tf", "modules/variables.tf"]
+        assert zip_file.read("modules/variables.tf") == b'variable "region" {}\n'
+
+
+def test_failed_zip_leaves_no_partial_file(tmp_path):
+    utils = FileUtilsService(output_dir=str(tmp_path))
+
+    with pytest.raises(TypeError):
+        utils.write_zip_to_disk({"main.tf": "# ok\n", "bad.tf": object()}, "bundle")
+    with pytest.raises(FileNotFoundError):
+        utils.write_zip_from_paths({"main.tf": str(tmp_path / "missing.tf")}, "bundle")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file modes only")
+def test_zip_written_to_disk_gets_umask_permissions(tmp_path):
+    utils = FileUtilsService(output_dir=str(tmp_path))
+    umask = os.umask(0o022)
+    try:
+        file_path, _ = utils.write_zip_to_disk({"main.tf": "# empty\n"})
+    finally:
+        os.umask(umask)
+
+    assert os.stat(file_path).st_mode & 0o777 == 0o644
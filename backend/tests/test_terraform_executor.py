@@ -0,0 +1,228 @@
+"""Tests for Terraform command construction in the executor."""
+
+import os
+import sys
+import tempfile
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.config import get_settings
+from app.core.database import Base
+from app.models import CloudPlatform, DeploymentEnvironment, DeploymentStatus, User
+from app.services import terraform_executor
+from app.services.terraform_executor import TerraformExecutor
+
+COMMAND_STDOUT = {
+    "plan": "Plan: 1 to add, 0 to change, 0 to destroy.",
+    "output": '{"vpc_id": {"value": "vpc-123"}}',
+}
+
+
+def _make_executor(monkeypatch, tmp_path):
+    """Return an executor over an in-memory database that records commands."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    db.add(
+        User(
+            id=1,
+            email="owner@example.com",
+            full_name="Owner",
+            provider="microsoft",
+            provider_user_id="provider-user-1",
+            is_active=True,
+        )
+    )
+    db.add(
+        DeploymentEnvironment(
+            id=1,
+            user_id=1,
+            name="aws-demo-env",
+            cloud_platform=CloudPlatform.AWS,
+            aws_region="us-east-1",
+        )
+    )
+    db.commit()
+
+    commands = []
+
+    def fake_run_command(self, args, work_dir, env, timeout=600, **kwargs):
+        commands.append(args)
+        return 0, COMMAND_STDOUT.get(args[1], ""), ""
+
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    monkeypatch.setattr(
+        TerraformExecutor, "_find_terraform_binary", lambda self: "terraform"
+    )
+    monkeypatch.setattr(TerraformExecutor, "_run_command", fake_run_command)
+    return TerraformExecutor(db), commands
+
+
+def test_plan_apply_and_destroy_pass_configured_parallelism(monkeypatch, tmp_path):
+    executor, commands = _make_executor(monkeypatch, tmp_path)
+    flag = f"-parallelism={get_settings().TERRAFORM_PARALLELISM}"
+    deployment = executor.create_deployment(
+        session_id=None, environment_id=1, terraform_code={"main.tf": ""}
+    )
+
+    deployment = executor.run_plan(deployment.deployment_id)
+    assert deployment.plan_summary == {"add": 1, "change": 0, "destroy": 0}
+    executor.run_apply(deployment.deployment_id)
+    deployment = executor.destroy_resources(deployment.deployment_id)
+
+    assert deployment.status == DeploymentStatus.DESTROYED
+    by_command = {args[1]: args for args in commands}
+    assert flag in by_command["plan"]
+    assert flag in by_command["apply"]
+    assert by_command["apply"][-1] == "tfplan"
+    assert flag in by_command["destroy"]
+    assert "output" not in by_command
+
+
+def test_apply_reads_outputs_only_when_configuration_declares_them(
+    monkeypatch, tmp_path
+):
+    executor, commands = _make_executor(monkeypatch, tmp_path)
+    deployment = executor.create_deployment(
+        session_id=None,
+        environment_id=1,
+        terraform_code={
+            "main.tf": 'resource "aws_vpc" "main" {}\n',
+            "outputs.tf": 'output "vpc_id" {\n  value = aws_vpc.main.id\n}\n',
+        },
+    )
+
+    executor.run_plan(deployment.deployment_id)
+    deployment = executor.run_apply(deployment.deployment_id)
+
+    assert [args[1] for args in commands] == ["init", "plan", "apply", "output"]
+    assert deployment.terraform_outputs == {"vpc_id": {"value": "vpc-123"}}
+
+
+def test_env_points_terraform_at_a_shared_plugin_cache(monkeypatch, tmp_path):
+    monkeypatch.delenv("TF_PLUGIN_CACHE_DIR", raising=False)
+    executor, _ = _make_executor(monkeypatch, tmp_path)
+    environment = executor.db.get(DeploymentEnvironment, 1)
+
+    env = executor._get_env_variables(environment)
+
+    assert env["TF_PLUGIN_CACHE_DIR"] == str(tmp_path / "iac4_plugin_cache")
+    assert (tmp_path / "iac4_plugin_cache").is_dir()
+    assert env["TF_PLUGIN_CACHE_MAY_BREAK_DEPENDENCY_LOCK_FILE"] == "1"
+    assert env["AWS_DEFAULT_REGION"] == "us-east-1"
+
+
+def test_init_holds_the_plugin_cache_lock(monkeypatch, tmp_path):
+    executor, _ = _make_executor(monkeypatch, tmp_path)
+    held = []
+
+    def fake_run_command(self, args, work_dir, env, timeout=600, **kwargs):
+        held.append((args[1], terraform_executor._PLUGIN_CACHE_LOCK.locked()))
+        return 0, "", ""
+
+    monkeypatch.setattr(TerraformExecutor, "_run_command", fake_run_command)
+    deployment = executor.create_deployment(
+        session_id=None, environment_id=1, terraform_code={"main.tf": ""}
+    )
+
+    executor.run_plan(deployment.deployment_id)
+
+    assert held == [("init", True), ("plan", False)]
+
+
+def _make_command_runner(monkeypatch, tmp_path):
+    """Return an executor whose commands really run."""
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    monkeypatch.setattr(
+        TerraformExecutor, "_find_terraform_binary", lambda self: "terraform"
+    )
+    return TerraformExecutor(db=None)
+
+
+def test_run_command_keeps_the_tail_of_each_stream(monkeypatch, tmp_path):
+    executor = _make_command_runner(monkeypatch, tmp_path)
+    monkeypatch.setattr(TerraformExecutor, "OUTPUT_TAIL_LINES", 3)
+    script = (
+        "import sys\n"
+        "for i in range(10): print(i)\n"
+        "print('boom', file=sys.stderr)\n"
+        "sys.exit(2)"
+    )
+
+    result = executor._run_command(
+        [sys.executable, "-c", script], str(tmp_path), env=None
+    )
+
+    assert result == (2, "7\n8\n9\n", "boom\n")
+
+
+def test_run_command_can_keep_full_output_out_of_the_logs(
+    monkeypatch, tmp_path, caplog
+):
+    executor = _make_command_runner(monkeypatch, tmp_path)
+    monkeypatch.setattr(TerraformExecutor, "OUTPUT_TAIL_LINES", 3)
+    script = "for i in range(10): print(f'secret-{i}')"
+
+    with caplog.at_level("INFO", logger=terraform_executor.__name__):
+        returncode, stdout, _ = executor._run_command(
+            [sys.executable, "-c", script],
+            str(tmp_path),
+            env=None,
+            log_output=False,
+            keep_all_output=True,
+        )
+
+    assert returncode == 0
+    assert stdout == "".join(f"secret-{i}\n" for i in range(10))
+    assert "secret" not in caplog.text
+
+
+def test_run_command_times_out(monkeypatch, tmp_path):
+    executor = _make_command_runner(monkeypatch, tmp_path)
+
+    result = executor._run_command(
+        [sys.executable, "-c", "import time; time.sleep(30)"],
+        str(tmp_path),
+        env=None,
+        timeout=1,
+    )
+
+    assert result == (-1, "", "Command timed out after 1 seconds")
+
+
+def test_terraform_binary_lookup_runs_once(monkeypatch, tmp_path):
+    binary = tmp_path / "terraform"
+    binary.write_text("")
+    lookups = []
+
+    def fake_which(name):
+        lookups.append(name)
+        return str(binary)
+
+    monkeypatch.setattr(terraform_executor.shutil, "which", fake_which)
+    terraform_executor._locate_terraform_binary.cache_clear()
+    try:
+        assert terraform_executor._locate_terraform_binary() == str(binary)
+        assert terraform_executor._locate_terraform_binary() == str(binary)
+    finally:
+        terraform_executor._locate_terraform_binary.cache_clear()
+
+    assert lookups == ["terraform"]
+
+
+def test_cleanup_moves_the_work_dir_out_of_the_way(monkeypatch, tmp_path):
+    executor, _ = _make_executor(monkeypatch, tmp_path)
+    deployment = executor.create_deployment(
+        session_id=None, environment_id=1, terraform_code={"main.tf": ""}
+    )
+    work_dir = executor.run_plan(deployment.deployment_id).work_dir
+
+    assert os.path.isdir(work_dir)
+    assert executor.cleanup_deployment(deployment.deployment_id) is True
+    assert not os.path.exists(work_dir)